@@ -16,26 +16,124 @@ Production Use Cases:
 
 Prerequisites:
 - aiohttp (pip install aiohttp)
+- uvloop (pip install uvloop) — optional, faster event loop for the examples
 """
 
 import asyncio
+import random
+import sys
 import time
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from collections import deque
+from typing import (
+    List, Dict, Any, AsyncIterator, Callable, Deque, Literal, Optional, Tuple
+)
 from dataclasses import dataclass
 
+# Import optional dependencies once; coroutines branch on the flag
+# instead of re-running the import machinery on every call
+try:
+    import aiohttp
+    _HAS_AIOHTTP = True
+except ImportError:
+    aiohttp = None
+    _HAS_AIOHTTP = False
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# slots=True (no per-instance __dict__) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class FetchResult:
+    """Result of a single fetch_url call."""
+    url: str
+    status: int
+    response_time: float
+    success: bool
+    content_length: int = 0
+    error: Optional[str] = None
+    simulated: bool = False
+
+
+# Module-wide session, created lazily by get_session(). A ClientSession
+# is bound to the event loop it was created on, so the loop is kept
+# alongside it and the session is rebuilt when a new loop asks for it
+# (e.g. a second asyncio.run()).
+_session: Optional["aiohttp.ClientSession"] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _create_session(
+    limit: int = 200, limit_per_host: int = 50
+) -> "aiohttp.ClientSession":
+    """
+    Build a ClientSession backed by a tuned TCPConnector.
+
+    The connector owns the keep-alive pool, so every request made through
+    the session reuses TCP/TLS connections and cached DNS lookups instead
+    of paying a full handshake per URL.
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    if not _HAS_AIOHTTP:
+        raise ImportError("aiohttp is required to create a ClientSession")
+
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=300,
+        keepalive_timeout=75
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def get_session() -> "aiohttp.ClientSession":
+    """
+    Return the shared aiohttp.ClientSession, creating it on first use.
+
+    The session is per event loop: calling this from a different (or
+    restarted) loop replaces the cached session instead of handing back
+    one whose loop is already closed.
+
+    Call close_session() on shutdown to release pooled connections.
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        # The previous loop is gone (or not ours), so its session can't be
+        # closed from here; drop it and let its loop's teardown reclaim it
+        _session = _create_session()
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session created by get_session(), if any."""
+    global _session, _session_loop
+    if (_session is not None and not _session.closed
+            and _session_loop is asyncio.get_running_loop()):
+        await _session.close()
+    _session = None
+    _session_loop = None
+
 
 async def fetch_url(
     url: str,
     timeout: float = 10.0,
-    headers: Optional[Dict[str, str]] = None
-) -> Dict[str, Any]:
+    headers: Optional[Dict[str, str]] = None,
+    session: Optional["aiohttp.ClientSession"] = None,
+    max_bytes: int = 65536
+) -> FetchResult:
     """
     Fetch a single URL asynchronously using aiohttp.
 
@@ -44,11 +142,15 @@ async def fetch_url(
 
     Args:
         url: URL to fetch
-        timeout: Request timeout in seconds
+        timeout: Total request timeout in seconds, body read included
         headers: Optional HTTP headers
+        session: Optional aiohttp.ClientSession to reuse
+                 (defaults to the shared session from get_session)
+        max_bytes: Stop reading the body after this many bytes; the
+                   reported size comes from Content-Length when present
 
     Returns:
-        Dictionary with url, status, response_time, and data or error
+        FetchResult with url, status, response_time, and size or error
 
     Interview Question:
         Q: How does async/await differ from threading for I/O-bound tasks?
@@ -58,130 +160,375 @@ async def fetch_url(
            avoids race conditions, and scales better for many concurrent I/O ops.
            Threading is better when you need to call blocking (non-async) libraries.
     """
-    try:
-        import aiohttp
+    if not _HAS_AIOHTTP:
+        # Fallback if aiohttp is not installed — simulate the call
+        logger.warning("aiohttp not installed. Using simulation.")
+        await asyncio.sleep(0.1)  # Simulate network delay
+        return FetchResult(
+            url=url,
+            status=200,
+            response_time=0.1,
+            success=True,
+            simulated=True
+        )
 
-        start_time = time.time()
+    try:
+        # loop.time() is monotonic — immune to NTP/wall-clock jumps
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
 
-        # Create a timeout object for the entire request
+        # One deadline for connect, request and body read. aiohttp starts
+        # it before a pooled connection is acquired, so batch callers
+        # queue on a semaphore first (see _iter_fetch_indexed)
         request_timeout = aiohttp.ClientTimeout(total=timeout)
 
-        # aiohttp.ClientSession should be reused in production,
-        # but for clarity we create one per call here
-        async with aiohttp.ClientSession(timeout=request_timeout) as session:
-            async with session.get(url, headers=headers or {}) as response:
-                # Read response body
-                body = await response.text()
-                elapsed = time.time() - start_time
-
-                return {
-                    'url': url,
-                    'status': response.status,
-                    'response_time': round(elapsed, 3),
-                    'content_length': len(body),
-                    'success': 200 <= response.status < 300
-                }
+        # Reuse one session so keep-alive connections, DNS cache and
+        # TLS sessions carry over between requests
+        if session is None:
+            session = await get_session()
+
+        async with session.get(
+            url, headers=headers or {}, timeout=request_timeout
+        ) as response:
+            # Read at most max_bytes — large bodies (e.g. metrics dumps)
+            # are abandoned instead of downloaded and decoded in full
+            body = b''
+            while len(body) < max_bytes:
+                chunk = await response.content.read(max_bytes - len(body))
+                if not chunk:
+                    break
+                body += chunk
+            elapsed = loop.time() - start_time
+
+            content_length = response.content_length
+            return FetchResult(
+                url=url,
+                status=response.status,
+                response_time=round(elapsed, 3),
+                success=200 <= response.status < 300,
+                content_length=(
+                    content_length if content_length is not None else len(body)
+                )
+            )
 
-    except ImportError:
-        # Fallback if aiohttp is not installed — simulate the call
-        logger.warning("aiohttp not installed. Using simulation.")
-        await asyncio.sleep(0.1)  # Simulate network delay
-        return {
-            'url': url,
-            'status': 200,
-            'response_time': 0.1,
-            'content_length': 0,
-            'success': True,
-            'simulated': True
-        }
     except asyncio.TimeoutError:
-        return {
-            'url': url,
-            'status': 0,
-            'response_time': timeout,
-            'error': 'Timeout',
-            'success': False
-        }
+        return FetchResult(
+            url=url,
+            status=0,
+            response_time=timeout,
+            success=False,
+            error='Timeout'
+        )
     except Exception as e:
-        return {
-            'url': url,
-            'status': 0,
-            'response_time': 0,
-            'error': str(e),
-            'success': False
-        }
+        return FetchResult(
+            url=url,
+            status=0,
+            response_time=0,
+            success=False,
+            error=str(e)
+        )
+
+
+class CreditSemaphore:
+    """
+    Throttle for APIs that meter requests by cost ("1000 credits/min").
+
+    Each transaction reserves a number of credits up front and gives them
+    back refund_time seconds after it finishes, so heavy endpoints use up
+    more of the budget than light ones. Waiters are served in arrival
+    order, but a smaller request that fits may go ahead of a larger one
+    that doesn't yet (opportunistic scheduling).
+
+    Example:
+        credits = CreditSemaphore(total_credits=1000, refill_interval=60)
+        result = await credits.transact(fetch_url(url), credits=20)
+
+    Interview Question:
+        Q: An API allows 1000 credits/minute and endpoints cost 1–20
+           credits each. How do you call it at full speed without 429s?
+        A: Track remaining credits client-side: reserve an endpoint's cost
+           before calling, refund it when the provider's window rolls
+           over, and queue callers that don't fit. A plain semaphore
+           treats every call as cost 1, so it either wastes quota or
+           overshoots it.
+    """
+
+    def __init__(self, total_credits: float, refill_interval: float = 60.0):
+        """
+        Args:
+            total_credits: Credits available per refill interval
+            refill_interval: Default seconds before spent credits are refunded
+
+        Raises:
+            ValueError: If total_credits is not positive
+        """
+        if total_credits <= 0:
+            raise ValueError("total_credits must be positive")
+        self._total = total_credits
+        self._available = total_credits
+        self._refill_interval = refill_interval
+        self._waiters: Deque[Tuple[float, asyncio.Future]] = deque()
+
+    @property
+    def available(self) -> float:
+        """Credits that can be spent right now."""
+        return self._available
+
+    async def acquire(self, credits: float) -> None:
+        """
+        Wait until credits are available, then reserve them.
+
+        Raises:
+            ValueError: If credits exceeds total_credits (could never run)
+        """
+        if credits > self._total:
+            raise ValueError(
+                f"Request costs {credits} credits but only {self._total} exist"
+            )
+
+        # Opportunistic: go now if it fits, even past a larger waiter
+        if credits <= self._available:
+            self._available -= credits
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((credits, future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Granted just before being cancelled — hand the credits back
+            if future.done() and not future.cancelled():
+                self._refund(credits)
+            raise
+
+    def _refund(self, credits: float) -> None:
+        """Return credits and let any waiters that now fit proceed."""
+        self._available = min(self._total, self._available + credits)
+
+        still_waiting: Deque[Tuple[float, asyncio.Future]] = deque()
+        for needed, future in self._waiters:
+            if future.done():
+                continue  # cancelled while waiting
+            if needed <= self._available:
+                self._available -= needed
+                future.set_result(None)
+            else:
+                still_waiting.append((needed, future))
+        self._waiters = still_waiting
+
+    async def transact(
+        self,
+        coro,
+        credits: float,
+        refund_time: Optional[float] = None
+    ) -> Any:
+        """
+        Run a coroutine once its credits are reserved.
+
+        Args:
+            coro: Coroutine to await (e.g. fetch_url(url))
+            credits: Cost of this call
+            refund_time: Seconds after completion before the credits are
+                         returned (defaults to refill_interval)
+
+        Returns:
+            Whatever the coroutine returns
+        """
+        try:
+            await self.acquire(credits)
+        except BaseException:
+            coro.close()  # never started — avoid "never awaited" warnings
+            raise
+
+        try:
+            return await coro
+        finally:
+            delay = self._refill_interval if refund_time is None else refund_time
+            asyncio.get_running_loop().call_later(delay, self._refund, credits)
+
+
+async def _iter_fetch_indexed(
+    urls: List[str],
+    timeout: float,
+    session,
+    max_concurrent: int,
+    credit_semaphore: Optional[CreditSemaphore] = None,
+    credit_cost: Optional[Callable[[str], float]] = None
+) -> AsyncIterator[Tuple[int, str, FetchResult]]:
+    """
+    Yield (index, url, result) for each URL as soon as its fetch finishes.
+
+    Owns the session/concurrency setup shared by iter_fetch, fetch_all_urls
+    and check_services_health. The index lets callers restore input order.
+    """
+    # One session for the whole batch — created here, closed in finally.
+    # Its connector is sized to max_concurrent, so a request let through
+    # the semaphore below gets a connection without queueing.
+    own_session = None
+    if session is None and _HAS_AIOHTTP:
+        own_session = session = _create_session(
+            limit=max_concurrent,
+            limit_per_host=max(4, max_concurrent // 4)
+        )
+
+    # Requests wait here, before fetch_url's timeout starts, so time spent
+    # behind other requests isn't charged against their deadline
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _fetch(url: str) -> FetchResult:
+        if credit_semaphore is None:
+            return await fetch_url(url, timeout=timeout, session=session)
+        return await credit_semaphore.transact(
+            fetch_url(url, timeout=timeout, session=session),
+            credits=credit_cost(url) if credit_cost is not None else 1
+        )
+
+    async def _fetch_one(index: int, url: str) -> Tuple[int, str, FetchResult]:
+        """Fetch one URL, converting unexpected exceptions to a failed result."""
+        try:
+            async with semaphore:
+                result = await _fetch(url)
+        except Exception as e:
+            result = FetchResult(
+                url=url,
+                status=0,
+                response_time=0,
+                success=False,
+                error=str(e)
+            )
+        return index, url, result
+
+    tasks = [
+        asyncio.create_task(_fetch_one(index, url))
+        for index, url in enumerate(urls)
+    ]
+
+    try:
+        # as_completed hands back results in finish order, so the caller
+        # sees the fastest response first instead of waiting for the slowest
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        # Consumer stopped early (break/cancel) — don't leak in-flight requests
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        if own_session is not None:
+            await own_session.close()
+
+
+async def iter_fetch(
+    urls: List[str],
+    *,
+    timeout: float = 10.0,
+    session: Optional["aiohttp.ClientSession"] = None,
+    max_concurrent: int = 10,
+    credit_semaphore: Optional[CreditSemaphore] = None,
+    credit_cost: Optional[Callable[[str], float]] = None
+) -> AsyncIterator[Tuple[str, FetchResult]]:
+    """
+    Fetch URLs concurrently, yielding (url, result) as each one completes.
+
+    Unlike fetch_all_urls, nothing is buffered: results stream out in
+    completion order, so the first one arrives after the fastest request
+    rather than the slowest, and the caller decides what to keep.
+
+    Args:
+        urls: List of URLs to fetch
+        timeout: Per-request timeout in seconds
+        session: Optional aiohttp.ClientSession to reuse; if omitted, one
+                 is created for this batch and closed afterwards
+        max_concurrent: Maximum number of simultaneous requests
+        credit_semaphore: Optional CreditSemaphore for cost-metered APIs
+        credit_cost: Credits charged per URL (default 1 each)
+
+    Yields:
+        (url, result) tuples, where result is a FetchResult
+
+    Example:
+        async for url, result in iter_fetch(urls, max_concurrent=20):
+            if not result.success:
+                alert(url, result.error)
+    """
+    async for _, url, result in _iter_fetch_indexed(
+        urls, timeout, session, max_concurrent, credit_semaphore, credit_cost
+    ):
+        yield url, result
 
 
 async def fetch_all_urls(
     urls: List[str],
     max_concurrent: int = 10,
-    timeout: float = 10.0
-) -> List[Dict[str, Any]]:
+    timeout: float = 10.0,
+    session: Optional["aiohttp.ClientSession"] = None,
+    credit_semaphore: Optional[CreditSemaphore] = None,
+    credit_cost: Optional[Callable[[str], float]] = None
+) -> List[FetchResult]:
     """
     Fetch multiple URLs concurrently with a concurrency limit.
 
-    Uses asyncio.Semaphore to limit the number of simultaneous requests,
-    preventing resource exhaustion and API rate limiting.
+    All requests share one ClientSession, and an asyncio.Semaphore caps
+    how many are in flight, preventing resource exhaustion and API rate
+    limiting. The session's TCPConnector is sized to the same limit.
+    Requests wait on the semaphore rather than in the connector's queue
+    because aiohttp's timeout clock is already running in that queue.
+
+    This is a thin wrapper that collects iter_fetch-style streamed results
+    back into input order; use iter_fetch to process them as they arrive.
 
     Args:
         urls: List of URLs to fetch
         max_concurrent: Maximum number of simultaneous requests
-        timeout: Per-request timeout in seconds
+        timeout: Per-request timeout in seconds (not counting time spent
+                 waiting for a concurrency slot)
+        session: Optional aiohttp.ClientSession to reuse; if omitted, one
+                 is created for this batch and closed afterwards
+        credit_semaphore: Optional CreditSemaphore shared by everything
+                          calling a cost-metered API
+        credit_cost: Credits charged per URL (default 1 each)
 
     Returns:
-        List of result dictionaries from fetch_url
+        List of FetchResult from fetch_url, in the order of urls
 
     Interview Question:
         Q: How do you prevent overloading a service with too many concurrent requests?
-        A: Use a semaphore to limit concurrency. asyncio.Semaphore acts as a
-           token bucket — only N coroutines can proceed at once. Others wait
-           until a slot becomes available. This protects both the client and server.
+        A: Cap concurrency with an asyncio.Semaphore (and size the
+           connection pool to match) — only N requests proceed at once, the
+           rest wait for a free slot. Gate before the request's timeout
+           starts, or queued requests time out without ever being sent.
+           This protects both the client and server.
     """
-    # Semaphore limits concurrent requests to avoid overwhelming servers
-    semaphore = asyncio.Semaphore(max_concurrent)
-
-    async def _fetch_with_limit(url: str) -> Dict[str, Any]:
-        """Wrap fetch_url with semaphore rate limiting."""
-        async with semaphore:
-            # Only max_concurrent coroutines reach this point simultaneously
-            return await fetch_url(url, timeout=timeout)
-
-    # Create all tasks — they start immediately but are gated by the semaphore
-    tasks = [_fetch_with_limit(url) for url in urls]
-
-    # asyncio.gather runs all tasks concurrently and collects results
-    # return_exceptions=True prevents one failure from canceling everything
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    # Process results, converting any exceptions to error dicts
-    processed = []
-    for url, result in zip(urls, results):
-        if isinstance(result, Exception):
-            processed.append({
-                'url': url,
-                'status': 0,
-                'error': str(result),
-                'success': False
-            })
-        else:
-            processed.append(result)
+    processed: List[Optional[FetchResult]] = [None] * len(urls)
+    async for index, _, result in _iter_fetch_indexed(
+        urls, timeout, session, max_concurrent, credit_semaphore, credit_cost
+    ):
+        processed[index] = result
 
     return processed
 
 
 async def check_services_health(
     services: Dict[str, str],
-    timeout: float = 5.0
+    timeout: float = 5.0,
+    session: Optional["aiohttp.ClientSession"] = None,
+    max_concurrent: int = 200
 ) -> Dict[str, Dict[str, Any]]:
     """
     Check health of multiple services concurrently.
 
     Takes a dictionary of service_name → health_url and checks them all
-    in parallel, returning a comprehensive health report.
+    in parallel, returning a comprehensive health report. Results are
+    consumed as they complete, so unhealthy services are logged the
+    moment their check fails rather than after the whole batch.
 
     Args:
         services: Dictionary mapping service names to health check URLs
         timeout: Health check timeout in seconds
+        session: Optional aiohttp.ClientSession to reuse; if omitted, one
+                 is created for this run and closed afterwards
+        max_concurrent: Maximum number of simultaneous checks
 
     Returns:
         Dictionary mapping service names to health status
@@ -201,43 +548,39 @@ async def check_services_health(
            based on patterns (e.g., >10% services down = P1 alert).
            Cache results to avoid excessive polling.
     """
-    start_time = time.time()
-
-    # Build tasks for all services
-    tasks = {}
-    for name, url in services.items():
-        tasks[name] = fetch_url(url, timeout=timeout)
-
-    # Run all health checks concurrently
-    results = await asyncio.gather(
-        *tasks.values(),
-        return_exceptions=True
-    )
-
-    # Build the health report
-    health_report = {}
-    for (name, _), result in zip(tasks.items(), results):
-        if isinstance(result, Exception):
-            health_report[name] = {
-                'status': 'down',
-                'error': str(result),
-                'response_time': None
-            }
-        elif result.get('success'):
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+
+    # Parallel lists (dict views iterate in the same order) — results are
+    # matched back to names by index, with no per-item tuple or lookup
+    names = list(services)
+    urls = list(services.values())
+
+    # Pre-seed keys so the report keeps the caller's service order
+    health_report: Dict[str, Dict[str, Any]] = dict.fromkeys(names)
+    async for index, _, result in _iter_fetch_indexed(
+        urls, timeout, session, max_concurrent
+    ):
+        name = names[index]
+        if result.success:
             health_report[name] = {
                 'status': 'healthy',
-                'response_time': result['response_time'],
-                'http_status': result['status']
+                'response_time': result.response_time,
+                'http_status': result.status
             }
         else:
             health_report[name] = {
                 'status': 'unhealthy',
-                'response_time': result.get('response_time'),
-                'http_status': result.get('status'),
-                'error': result.get('error')
+                'response_time': result.response_time,
+                'http_status': result.status,
+                'error': result.error
             }
+            logger.warning(
+                f"Service '{name}' unhealthy: "
+                f"status={result.status}, error={result.error}"
+            )
 
-    total_time = time.time() - start_time
+    total_time = loop.time() - start_time
     logger.info(
         f"Health check complete: {len(services)} services checked "
         f"in {total_time:.2f}s"
@@ -246,19 +589,35 @@ async def check_services_health(
     return health_report
 
 
+def _is_retryable(exc: Exception) -> bool:
+    """
+    Decide whether an exception is worth retrying.
+
+    HTTP 4xx responses (other than 429 Too Many Requests) mean the request
+    itself is wrong — sending it again will fail the same way.
+    """
+    if _HAS_AIOHTTP and isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return True
+
+
 async def async_retry(
     coroutine_func,
     *args,
     max_retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
+    max_delay: float = 60.0,
+    jitter: Literal['none', 'full', 'decorrelated'] = 'decorrelated',
     **kwargs
 ) -> Any:
     """
-    Retry an async function with exponential backoff.
+    Retry an async function with exponential backoff and jitter.
 
     Just like sync retry, but uses asyncio.sleep instead of time.sleep,
-    so other coroutines can run during the wait.
+    so other coroutines can run during the wait. The backoff schedule is
+    computed once up front (no float drift from repeated multiplication),
+    and jitter spreads out callers that failed at the same moment.
 
     Args:
         coroutine_func: Async function to retry
@@ -266,23 +625,48 @@ async def async_retry(
         max_retries: Maximum retry attempts
         delay: Initial delay in seconds
         backoff: Delay multiplier
+        max_delay: Upper bound for any single wait, in seconds
+        jitter: 'none' — sleep exactly the scheduled delay
+                'full' — uniform between 0 and the scheduled delay
+                'decorrelated' — uniform between delay and 3x the
+                scheduled delay, capped at max_delay
         **kwargs: Keyword arguments
 
     Returns:
         Result of the coroutine
 
+    Raises:
+        ValueError: If jitter is not one of the supported modes
+
     Example:
         result = await async_retry(
             fetch_url, 'http://flaky-api.com/data',
             max_retries=5, delay=2.0
         )
+
+    Interview Question:
+        Q: 500 clients fail at the same instant. Why is plain exponential
+           backoff not enough?
+        A: They all compute the same delays and retry in lockstep, hitting
+           the recovering service with synchronized spikes (thundering
+           herd). Randomizing each wait (jitter) spreads the retries out.
     """
-    current_delay = delay
+    if jitter not in ('none', 'full', 'decorrelated'):
+        raise ValueError(f"Unknown jitter mode: {jitter!r}")
+
+    # Delay before retry N, computed once: delay * backoff^N, capped
+    schedule = [min(max_delay, delay * backoff ** i) for i in range(max_retries)]
 
     for attempt in range(max_retries + 1):
         try:
             return await coroutine_func(*args, **kwargs)
         except Exception as e:
+            if not _is_retryable(e):
+                logger.error(
+                    f"Non-retryable error from '{coroutine_func.__name__}': {e}"
+                )
+                raise
+
             if attempt == max_retries:
                 logger.error(
                     f"Async retry exhausted for '{coroutine_func.__name__}' "
@@ -290,15 +674,21 @@ async def async_retry(
                 )
                 raise
 
+            if jitter == 'full':
+                sleep_for = random.uniform(0, schedule[attempt])
+            elif jitter == 'decorrelated':
+                sleep_for = min(max_delay, random.uniform(delay, schedule[attempt] * 3))
+            else:
+                sleep_for = schedule[attempt]
+
             logger.warning(
                 f"Async retry {attempt + 1}/{max_retries + 1} for "
                 f"'{coroutine_func.__name__}': {e}. "
-                f"Waiting {current_delay:.1f}s..."
+                f"Waiting {sleep_for:.1f}s..."
             )
 
             # Use asyncio.sleep so other tasks can run during the wait
-            await asyncio.sleep(current_delay)
-            current_delay *= backoff
+            await asyncio.sleep(sleep_for)
 
 
 # ============================================================
@@ -321,14 +711,14 @@ if __name__ == "__main__":
             "https://httpbin.org/status/500",
         ]
 
-        start = time.time()
+        start = time.perf_counter()
         results = await fetch_all_urls(urls, max_concurrent=5, timeout=5.0)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         for r in results:
-            status = "✓" if r.get('success') else "✗"
-            print(f"  {status} {r['url']}: status={r.get('status')}, "
-                  f"time={r.get('response_time', 'N/A')}s")
+            status = "✓" if r.success else "✗"
+            print(f"  {status} {r.url}: status={r.status}, "
+                  f"time={r.response_time}s")
 
         print(f"\n  Total time: {elapsed:.2f}s (sequential would be ~{len(urls) * 1.0}s)")
 
@@ -347,4 +737,11 @@ if __name__ == "__main__":
             print(f"  {icon} {name}: {status['status']}")
 
     # Run the async main function
+    # uvloop is a libuv-based drop-in for the default event loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -16,13 +16,25 @@ Production Use Cases:
 
 Prerequisites:
 - aiohttp (pip install aiohttp) — optional, falls back to simulation
+- uvloop (pip install uvloop) — optional, faster event loop for the examples
 """
 
 import asyncio
+import sys
 import time
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, field
+from typing import Dict, List, Literal, Optional, Any, Tuple
+from dataclasses import dataclass, field, replace
+from heapq import heappush, heapreplace
+
+# Import optional dependencies once; coroutines branch on the flag
+# instead of re-running the import machinery on every call
+try:
+    import aiohttp
+    _HAS_AIOHTTP = True
+except ImportError:
+    aiohttp = None
+    _HAS_AIOHTTP = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -31,9 +43,13 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# slots=True (no per-instance __dict__) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class HealthCheckResult:
-    """Result of a single health check."""
+    """Result of a single health check (immutable, safe to cache/share)."""
     service_name: str
     url: str
     is_healthy: bool
@@ -42,11 +58,169 @@ class HealthCheckResult:
     error: Optional[str] = None
 
 
+# Freshness bounds (min_seconds, max_seconds) for each cache policy
+CACHE_POLICIES: Dict[str, Tuple[float, float]] = {
+    'short': (1.0, 5.0),
+    'normal': (5.0, 30.0),
+    'long': (30.0, 300.0),
+}
+
+# Added to the observed response time when computing freshness
+_FRESHNESS_BUFFER = 1.0
+
+CachePolicy = Literal['short', 'normal', 'long']
+
+# (url, method, expected_status) — a HEAD and a GET of the same URL can
+# legitimately get different answers, so they are cached separately
+CacheKey = Tuple[str, str, int]
+
+
+class TTLCache:
+    """
+    In-process cache of health check results with per-entry TTL.
+
+    Expired entries are kept (until overwritten or cleared) so they can
+    be served as a stale fallback when the upstream check fails.
+
+    Interview Question:
+        Q: A dashboard polls 200 services every 5s. How do you cut load?
+        A: Cache each result for a short, per-endpoint TTL — most statuses
+           are stable between polls. Scale the TTL with how slow/expensive
+           the endpoint is, clamp it per policy, and serve the last known
+           good result (flagged as stale) if a refresh fails.
+    """
+
+    def __init__(self):
+        self._store: Dict[CacheKey, Tuple[float, HealthCheckResult]] = {}
+
+    def get(
+        self,
+        key: CacheKey,
+        allow_stale: bool = False
+    ) -> Optional[HealthCheckResult]:
+        """
+        Retrieve a cached result.
+
+        Args:
+            key: (url, method, expected_status)
+            allow_stale: If True, return expired entries too
+
+        Returns:
+            Cached HealthCheckResult or None
+        """
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if not allow_stale and time.monotonic() > expires_at:
+            return None
+        return result
+
+    def set(self, key: CacheKey, result: HealthCheckResult, ttl: float) -> None:
+        """Store a result that stays fresh for ttl seconds."""
+        self._store[key] = (time.monotonic() + ttl, result)
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        self._store.clear()
+
+
+# Shared by all checks that opt in via cache_policy
+_health_cache = TTLCache()
+
+
+def _freshness(elapsed_ms: float, cache_policy: str) -> float:
+    """
+    Compute how long a result stays fresh.
+
+    Slower endpoints are cached longer (they're more expensive to poll),
+    clamped to the policy's bounds.
+    """
+    policy_min, policy_max = CACHE_POLICIES[cache_policy]
+    return min(max(elapsed_ms / 1000 + _FRESHNESS_BUFFER, policy_min), policy_max)
+
+
+def _stale_fallback(
+    cache_key: CacheKey,
+    service_name: str
+) -> Optional[HealthCheckResult]:
+    """Return the last known good result marked as stale, if there is one."""
+    cached = _health_cache.get(cache_key, allow_stale=True)
+    if cached is None or not cached.is_healthy:
+        return None
+    logger.warning(f"Serving STALE health result for '{service_name}'")
+    return replace(cached, service_name=service_name, error="stale")
+
+
+# Module-wide session, created lazily by get_session(). A ClientSession
+# is bound to the event loop it was created on, so the loop is kept
+# alongside it and the session is rebuilt when a new loop asks for it
+# (e.g. a second asyncio.run()).
+_session: Optional["aiohttp.ClientSession"] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _create_session(
+    limit: int = 200, limit_per_host: int = 50
+) -> "aiohttp.ClientSession":
+    """
+    Build a ClientSession with a pooled, keep-alive TCPConnector.
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    if not _HAS_AIOHTTP:
+        raise ImportError("aiohttp is required to create a ClientSession")
+
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=300,
+        keepalive_timeout=75
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def get_session() -> "aiohttp.ClientSession":
+    """
+    Return the shared aiohttp.ClientSession, creating it on first use.
+
+    The session is per event loop: calling this from a different (or
+    restarted) loop replaces the cached session instead of handing back
+    one whose loop is already closed.
+
+    Raises:
+        ImportError: If aiohttp is not installed
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        # The previous loop is gone (or not ours), so its session can't be
+        # closed from here; drop it and let its loop's teardown reclaim it
+        _session = _create_session()
+        _session_loop = loop
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session created by get_session(), if any."""
+    global _session, _session_loop
+    if (_session is not None and not _session.closed
+            and _session_loop is asyncio.get_running_loop()):
+        await _session.close()
+    _session = None
+    _session_loop = None
+
+
 async def check_single_service(
     service_name: str,
     url: str,
     timeout: float = 5.0,
-    expected_status: int = 200
+    expected_status: int = 200,
+    session: Optional["aiohttp.ClientSession"] = None,
+    cache_policy: Optional[CachePolicy] = None,
+    method: str = "HEAD"
 ) -> HealthCheckResult:
     """
     Check health of a single service endpoint.
@@ -56,29 +230,33 @@ async def check_single_service(
         url: Health check URL
         timeout: Request timeout in seconds
         expected_status: Expected HTTP status code
+        session: Optional aiohttp.ClientSession to reuse
+                 (defaults to the shared session from get_session)
+        cache_policy: 'short', 'normal' or 'long' to serve recent results
+                      from cache (see CACHE_POLICIES); None always checks live
+        method: HTTP method. HEAD (default) skips the response body; use
+                'GET' for endpoints that don't support HEAD
 
     Returns:
         HealthCheckResult with timing and status info
     """
-    start = time.time()
-    try:
-        import aiohttp
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url, timeout=aiohttp.ClientTimeout(total=timeout)
-            ) as resp:
-                elapsed_ms = (time.time() - start) * 1000
-                return HealthCheckResult(
-                    service_name=service_name,
-                    url=url,
-                    is_healthy=(resp.status == expected_status),
-                    response_time_ms=round(elapsed_ms, 2),
-                    status_code=resp.status
-                )
-    except ImportError:
+    cache_key = (url, method.upper(), expected_status)
+    if cache_policy is not None:
+        cached = _health_cache.get(cache_key)
+        if cached is not None:
+            if cached.service_name != service_name:
+                cached = replace(cached, service_name=service_name)
+            return cached
+
+    # loop.time() is monotonic — response times can't go negative if
+    # the wall clock is stepped mid-request
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    if not _HAS_AIOHTTP:
         # Simulate health check when aiohttp isn't installed
         await asyncio.sleep(0.05)
-        elapsed_ms = (time.time() - start) * 1000
+        elapsed_ms = (loop.time() - start) * 1000
         return HealthCheckResult(
             service_name=service_name,
             url=url,
@@ -86,8 +264,37 @@ async def check_single_service(
             response_time_ms=round(elapsed_ms, 2),
             status_code=200
         )
+
+    try:
+        if session is None:
+            session = await get_session()
+        # Only the status matters, so the body is never read
+        async with session.request(
+            method,
+            url,
+            # One deadline for the whole check; check_all_services queues
+            # checks on a semaphore so this clock starts once it's their turn
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as resp:
+            elapsed_ms = (loop.time() - start) * 1000
+            result = HealthCheckResult(
+                service_name=service_name,
+                url=url,
+                is_healthy=(resp.status == expected_status),
+                response_time_ms=round(elapsed_ms, 2),
+                status_code=resp.status
+            )
+        if cache_policy is not None:
+            _health_cache.set(
+                cache_key, result, ttl=_freshness(elapsed_ms, cache_policy)
+            )
+        return result
     except asyncio.TimeoutError:
-        elapsed_ms = (time.time() - start) * 1000
+        if cache_policy is not None:
+            stale = _stale_fallback(cache_key, service_name)
+            if stale is not None:
+                return stale
+        elapsed_ms = (loop.time() - start) * 1000
         return HealthCheckResult(
             service_name=service_name,
             url=url,
@@ -96,7 +303,11 @@ async def check_single_service(
             error=f"Timeout after {timeout}s"
         )
     except Exception as e:
-        elapsed_ms = (time.time() - start) * 1000
+        if cache_policy is not None:
+            stale = _stale_fallback(cache_key, service_name)
+            if stale is not None:
+                return stale
+        elapsed_ms = (loop.time() - start) * 1000
         return HealthCheckResult(
             service_name=service_name,
             url=url,
@@ -109,7 +320,10 @@ async def check_single_service(
 async def check_all_services(
     services: Dict[str, str],
     timeout: float = 5.0,
-    max_concurrent: int = 20
+    max_concurrent: int = 20,
+    session: Optional["aiohttp.ClientSession"] = None,
+    cache_policy: Optional[CachePolicy] = None,
+    method: str = "HEAD"
 ) -> List[HealthCheckResult]:
     """
     Check health of all services concurrently with concurrency limit.
@@ -118,25 +332,48 @@ async def check_all_services(
         services: Dict of service_name → health_url
         timeout: Per-request timeout
         max_concurrent: Maximum simultaneous checks
+        session: Optional aiohttp.ClientSession to reuse; if omitted, one
+                 is created for this run and closed afterwards
+        cache_policy: Optional cache policy passed to check_single_service
+        method: HTTP method passed to check_single_service
 
     Returns:
         List of HealthCheckResult for all services
 
     Interview Question:
         Q: How would you design a health check system for 500+ microservices?
-        A: Use async I/O for concurrency, semaphore for rate limiting,
+        A: Use async I/O for concurrency, a semaphore (with a matching
+           connection pool size) for rate limiting,
            configurable timeouts per service, categorize results
            (healthy/degraded/down), cache results with TTL, alert on
            patterns (>5% down = P1).
     """
+    # Every check shares one connection pool instead of a session per URL,
+    # sized so a check let through the semaphore never queues for it
+    own_session = None
+    if session is None and _HAS_AIOHTTP:
+        own_session = session = _create_session(
+            limit=max_concurrent,
+            limit_per_host=max(4, max_concurrent // 4)
+        )
+
+    # Checks wait here, before their timeout starts, so a long queue
+    # doesn't turn healthy services into timeouts
     semaphore = asyncio.Semaphore(max_concurrent)
 
     async def _limited_check(name: str, url: str) -> HealthCheckResult:
         async with semaphore:
-            return await check_single_service(name, url, timeout)
+            return await check_single_service(
+                name, url, timeout,
+                session=session, cache_policy=cache_policy, method=method
+            )
 
     tasks = [_limited_check(name, url) for name, url in services.items()]
-    results = await asyncio.gather(*tasks)
+    try:
+        results = await asyncio.gather(*tasks)
+    finally:
+        if own_session is not None:
+            await own_session.close()
     return list(results)
 
 
@@ -150,25 +387,41 @@ def generate_health_report(results: List[HealthCheckResult]) -> Dict[str, Any]:
     Returns:
         Summary report with counts, slowest services, etc.
     """
-    healthy = [r for r in results if r.is_healthy]
-    unhealthy = [r for r in results if not r.is_healthy]
+    healthy_count = 0
+    total_ms = 0.0
+    unhealthy = []
 
-    # Sort by response time to find slowest services
-    by_response_time = sorted(results, key=lambda r: r.response_time_ms, reverse=True)
+    # Min-heap of the 5 slowest seen so far. -position breaks ties in
+    # favour of earlier results and keeps results themselves uncompared.
+    slowest_heap = []
 
-    avg_response = (
-        sum(r.response_time_ms for r in results) / len(results) if results else 0
-    )
+    # Single pass: counts, running sum and top-5 together
+    for position, r in enumerate(results):
+        total_ms += r.response_time_ms
+        if r.is_healthy:
+            healthy_count += 1
+        else:
+            unhealthy.append(r)
+
+        entry = (r.response_time_ms, -position, r)
+        if len(slowest_heap) < 5:
+            heappush(slowest_heap, entry)
+        elif entry > slowest_heap[0]:
+            heapreplace(slowest_heap, entry)
+
+    slowest = [entry[2] for entry in sorted(slowest_heap, reverse=True)]
+
+    avg_response = total_ms / len(results) if results else 0
 
     return {
         'total': len(results),
-        'healthy': len(healthy),
+        'healthy': healthy_count,
         'unhealthy': len(unhealthy),
-        'health_percentage': round(len(healthy) / len(results) * 100, 1) if results else 0,
+        'health_percentage': round(healthy_count / len(results) * 100, 1) if results else 0,
         'avg_response_ms': round(avg_response, 2),
         'slowest_services': [
             {'name': r.service_name, 'time_ms': r.response_time_ms}
-            for r in by_response_time[:5]
+            for r in slowest
         ],
         'failed_services': [
             {'name': r.service_name, 'error': r.error}
@@ -195,10 +448,10 @@ if __name__ == "__main__":
         }
 
         print(f"\nChecking {len(services)} services concurrently...")
-        start = time.time()
+        start = time.perf_counter()
 
         results = await check_all_services(services, timeout=5.0)
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
 
         # Print individual results
         for r in results:
@@ -214,4 +467,11 @@ if __name__ == "__main__":
         print(f"  Avg response: {report['avg_response_ms']:.0f}ms")
         print(f"  Total check time: {elapsed:.2f}s")
 
+    # uvloop is a libuv-based drop-in for the default event loop
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     asyncio.run(main())
@@ -0,0 +1,98 @@
+"""
+_pool_sizing.py
+
+Worker-count helpers shared by the concurrency examples.
+
+Interview Topics:
+- How many workers should a pool have?
+- CPU affinity and container CPU limits
+- Memory-aware pool sizing
+
+Production Use Cases:
+- Sizing process pools inside Kubernetes pods / cpuset-pinned jobs
+- Keeping memory-heavy batch jobs from OOMing the host
+
+Prerequisites:
+- No external packages needed (stdlib only)
+- psutil (pip install psutil) — optional, memory-aware worker caps
+"""
+
+import os
+import logging
+from typing import Optional
+
+try:
+    import psutil
+    _HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    _HAS_PSUTIL = False
+
+logger = logging.getLogger(__name__)
+
+
+def available_cpus() -> int:
+    """
+    CPUs this process may actually run on.
+
+    os.cpu_count() reports every CPU on the host; inside a container or
+    a cpuset-pinned job (Kubernetes limits, SLURM) that oversubscribes
+    the pool and workers thrash on context switches. The affinity mask
+    reflects the pinning (Linux only — fall back elsewhere).
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def safe_workers(requested: int, per_worker_mb: int) -> int:
+    """
+    Cap a worker count so the pool's expected memory fits in free RAM.
+
+    One CPU-bound worker per core can still OOM the box when each
+    worker holds a large file or dataset. Without psutil only the
+    lower bound of 1 is applied.
+
+    Args:
+        requested: Desired number of workers
+        per_worker_mb: Expected peak memory per worker in MB
+
+    Returns:
+        Worker count, at least 1
+    """
+    if not _HAS_PSUTIL or per_worker_mb <= 0:
+        return max(1, requested)
+
+    available_mb = psutil.virtual_memory().available // (1024 * 1024)
+    workers = max(1, min(requested, available_mb // per_worker_mb))
+    if workers < requested:
+        logger.info(
+            f"Capping workers at {workers} (requested {requested}): "
+            f"{available_mb} MB available, ~{per_worker_mb} MB per worker"
+        )
+    return workers
+
+
+# Below this many items a pool can't win: process start-up, pickling
+# and IPC cost more than just running the items in this process
+SEQUENTIAL_THRESHOLD = int(os.environ.get('SEQUENTIAL_THRESHOLD', '4'))
+
+# Rough cost of starting a pool — total work below this runs in-process
+_POOL_STARTUP_S = 0.05
+
+
+def run_sequentially(n_items: int, min_item_cost_s: Optional[float] = None) -> bool:
+    """
+    Decide whether a job is too small to be worth a process pool.
+
+    Args:
+        n_items: Number of items to process
+        min_item_cost_s: Caller's estimate of seconds per item, if known
+
+    Returns:
+        True if the items should simply be processed in a loop
+    """
+    if n_items < SEQUENTIAL_THRESHOLD:
+        return True
+    return min_item_cost_s is not None and n_items * min_item_cost_s < _POOL_STARTUP_S
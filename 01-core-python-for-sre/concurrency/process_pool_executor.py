@@ -16,13 +16,20 @@ Production Use Cases:
 
 Prerequisites:
 - No external packages needed (stdlib only)
+- psutil (pip install psutil) — optional, memory-aware worker caps
 """
 
 import os
 import time
+import array
 import logging
+import importlib
+import multiprocessing as mp
 from concurrent.futures import ProcessPoolExecutor, as_completed, TimeoutError
-from typing import List, Dict, Any, Callable, TypeVar, Iterator
+from typing import List, Dict, Any, Callable, TypeVar, Iterator, Optional, Sequence, Union
+
+# Pool-sizing helpers shared with the other concurrency examples
+from _pool_sizing import available_cpus, run_sequentially, safe_workers
 
 logging.basicConfig(
     level=logging.INFO,
@@ -32,13 +39,16 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
-
 def map_with_progress(
     func: Callable,
     items: list,
     max_workers: int = None,
-    description: str = "Processing"
-) -> List[Any]:
+    description: str = "Processing",
+    *,
+    typecode: Optional[str] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    min_item_cost_s: Optional[float] = None
+) -> Union[List[Any], array.array]:
     """
     Process items in parallel with progress tracking.
 
@@ -47,12 +57,48 @@ def map_with_progress(
         items: Items to process
         max_workers: Number of workers
         description: Progress bar description
+        typecode: For numeric results, an array module typecode
+                  (e.g. 'q' for int64, 'd' for float64). Results are then
+                  stored unboxed in one contiguous typed buffer instead of
+                  a list of Python objects — several times less memory.
+                  A typed buffer can't hold an error marker, so a failing
+                  item raises instead
+        progress: Called as progress(completed, total) about every 10%;
+                  defaults to printing a line. Pass a no-op to silence
+                  it (e.g. in benchmarks)
+        min_item_cost_s: Estimated seconds per item; if the whole job is
+                         cheaper than starting a pool, run it in-process
 
     Returns:
-        List of results in original order
+        List of results in original order (an array.array if typecode is set)
     """
     total = len(items)
-    results = [None] * total  # Pre-allocate for ordered results
+    # Pre-allocate for ordered results
+    if typecode is None:
+        results = [None] * total
+    else:
+        results = array.array(typecode, [0]) * total
+
+    if progress is None:
+        def progress(completed: int, total: int) -> None:
+            print(f"  {description}: {completed}/{total} ({completed / total * 100:.0f}%)")
+
+    # Report roughly every 10% — computed once, not per completion
+    stride = max(1, total // 10)
+
+    if run_sequentially(total, min_item_cost_s):
+        for idx, item in enumerate(items):
+            try:
+                results[idx] = func(item)
+            except Exception as e:
+                if typecode is not None:
+                    raise
+                results[idx] = {'error': str(e)}
+
+            completed = idx + 1
+            if completed % stride == 0 or completed == total:
+                progress(completed, total)
+        return results
 
     with ProcessPoolExecutor(max_workers=max_workers) as executor:
         future_to_idx = {
@@ -66,36 +112,80 @@ def map_with_progress(
             try:
                 results[idx] = future.result()
             except Exception as e:
+                if typecode is not None:
+                    raise
                 results[idx] = {'error': str(e)}
 
             completed += 1
-            if completed % max(1, total // 10) == 0 or completed == total:
-                pct = completed / total * 100
-                print(f"  {description}: {completed}/{total} ({pct:.0f}%)")
+            if completed % stride == 0 or completed == total:
+                progress(completed, total)
 
     return results
 
 
+def _pool_context(preload_modules: Sequence[str] = ()) -> mp.context.BaseContext:
+    """
+    Multiprocessing context for long-lived pools.
+
+    Where available (POSIX), forkserver forks workers from a small,
+    single-threaded server process. That keeps most of the speed of fork
+    without the children inheriting locks held by this process's other
+    threads (logging handlers, thread pools), which can deadlock them. Modules handed to set_forkserver_preload() are
+    imported once in the server, so every worker starts with them
+    loaded. The preload list only applies if the server hasn't started
+    yet; _preload_modules still runs as the pool initializer to cover
+    that case. Elsewhere (Windows) the platform default, spawn, is used.
+    """
+    if 'forkserver' not in mp.get_all_start_methods():
+        return mp.get_context()
+
+    ctx = mp.get_context('forkserver')
+    if preload_modules:
+        ctx.set_forkserver_preload(list(preload_modules))
+    return ctx
+
+
+def _preload_modules(module_names: Sequence[str]) -> None:
+    """Pool initializer — import heavy modules once per worker, not per task."""
+    for name in module_names:
+        importlib.import_module(name)
+
+
 def batch_process(
     func: Callable,
     items: list,
     batch_size: int = 100,
-    max_workers: int = None
-) -> List[Any]:
+    max_workers: int = None,
+    executor: Optional[ProcessPoolExecutor] = None,
+    preload_modules: Sequence[str] = (),
+    per_worker_mb: int = 256,
+    min_item_cost_s: Optional[float] = None
+) -> Iterator[Any]:
     """
-    Process items in batches using a process pool.
+    Process items in batches using a process pool, yielding results.
 
     Useful when you have thousands of items and want to
     control memory usage by processing in smaller batches.
+    Every batch runs on the same pool, so worker start-up is
+    paid once rather than once per batch. Results are streamed
+    to the caller instead of accumulated, and each worker receives
+    its share of a batch in a few chunks rather than item by item.
 
     Args:
         func: Function to apply to each item
         items: All items to process
         batch_size: Items per batch
-        max_workers: Workers per batch
-
-    Returns:
-        All results combined
+        max_workers: Number of worker processes (default: usable CPUs)
+        executor: Existing pool to reuse across calls (left running);
+                  if None, one pool is created for all batches
+        preload_modules: Module names each new worker imports on start-up
+        per_worker_mb: Expected peak memory per worker; a new pool's
+                       worker count is capped so it fits in available RAM
+        min_item_cost_s: Estimated seconds per item; if the whole job is
+                         cheaper than starting a pool, run it in-process
+
+    Yields:
+        Results in input order
 
     Interview Question:
         Q: How do you manage memory when processing millions of records?
@@ -105,24 +195,75 @@ def batch_process(
            4. Use shared memory for large read-only data
            5. Monitor RSS memory per worker process
     """
-    all_results = []
-    total_batches = (len(items) + batch_size - 1) // batch_size
+    if run_sequentially(len(items), min_item_cost_s):
+        yield from map(func, items)
+        return
 
-    for batch_num in range(total_batches):
-        start_idx = batch_num * batch_size
-        end_idx = min(start_idx + batch_size, len(items))
-        batch = items[start_idx:end_idx]
+    if max_workers is None:
+        max_workers = available_cpus()
 
-        logger.info(
-            f"Processing batch {batch_num + 1}/{total_batches} "
-            f"(items {start_idx}-{end_idx - 1})"
+    owns_executor = executor is None
+    if owns_executor:
+        max_workers = safe_workers(max_workers, per_worker_mb)
+
+    total_batches = (len(items) + batch_size - 1) // batch_size
+    # ~4 chunks per worker per batch — few IPC exchanges, still balanced
+    chunksize = max(1, batch_size // (max_workers * 4))
+
+    if owns_executor:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_pool_context(preload_modules),
+            initializer=_preload_modules,
+            initargs=(tuple(preload_modules),)
         )
 
-        with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            batch_results = list(executor.map(func, batch))
-            all_results.extend(batch_results)
+    try:
+        for batch_num in range(total_batches):
+            start_idx = batch_num * batch_size
+            end_idx = min(start_idx + batch_size, len(items))
+            batch = items[start_idx:end_idx]
+
+            logger.info(
+                f"Processing batch {batch_num + 1}/{total_batches} "
+                f"(items {start_idx}-{end_idx - 1})"
+            )
+
+            yield from executor.map(func, batch, chunksize=chunksize)
+    finally:
+        # A caller-supplied pool is left running for reuse
+        if owns_executor:
+            executor.shutdown()
+
+
+def batch_process_list(
+    func: Callable,
+    items: list,
+    batch_size: int = 100,
+    max_workers: int = None,
+    executor: Optional[ProcessPoolExecutor] = None,
+    preload_modules: Sequence[str] = (),
+    per_worker_mb: int = 256,
+    min_item_cost_s: Optional[float] = None
+) -> List[Any]:
+    """
+    batch_process, collected into a list — for callers that need all results.
+
+    Args:
+        Same as batch_process
 
-    return all_results
+    Returns:
+        All results combined
+    """
+    return list(batch_process(
+        func, items,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        executor=executor,
+        preload_modules=preload_modules,
+        per_worker_mb=per_worker_mb,
+        min_item_cost_s=min_item_cost_s
+    ))
 
 
 def process_with_timeout(
@@ -179,27 +320,35 @@ def process_with_timeout(
     return results
 
 
+# Example workers live at module level: forkserver/spawn children
+# import this module by name, so functions nested under __main__
+# can't be unpickled there
+def square(n: int) -> int:
+    """Simple CPU-bound computation."""
+    time.sleep(0.01)
+    return n * n
+
+
+def slow_task(n: int) -> int:
+    if n == 3:
+        time.sleep(100)  # This one will timeout
+    return n * n
+
+
 # ============================================================
 # Usage Examples
 # ============================================================
 if __name__ == "__main__":
-    import multiprocessing as mp
-
     print("=" * 60)
     print("ProcessPoolExecutor Patterns — Usage Examples")
     print("=" * 60)
 
-    def square(n: int) -> int:
-        """Simple CPU-bound computation."""
-        time.sleep(0.01)
-        return n * n
-
     # ---- Example 1: Map with progress ----
     print("\n--- Example 1: Map with Progress ---")
     numbers = list(range(20))
     results = map_with_progress(
         square, numbers,
-        max_workers=min(4, mp.cpu_count()),
+        max_workers=min(4, available_cpus()),
         description="Computing squares"
     )
     print(f"  First 10 results: {results[:10]}")
@@ -207,7 +356,7 @@ if __name__ == "__main__":
     # ---- Example 2: Batch processing ----
     print("\n--- Example 2: Batch Processing ---")
     large_list = list(range(50))
-    batch_results = batch_process(
+    batch_results = batch_process_list(
         square, large_list,
         batch_size=20,
         max_workers=2
@@ -217,11 +366,6 @@ if __name__ == "__main__":
     # ---- Example 3: Timeout per item ----
     print("\n--- Example 3: Per-Item Timeout ---")
 
-    def slow_task(n: int) -> int:
-        if n == 3:
-            time.sleep(100)  # This one will timeout
-        return n * n
-
     timeout_results = process_with_timeout(
         slow_task,
         [1, 2, 3, 4, 5],
@@ -19,9 +19,11 @@ Prerequisites:
 """
 
 import time
+import heapq
 import logging
 import queue
 import threading
+from collections import deque
 from typing import Any, Callable, Dict, List, Optional
 
 logging.basicConfig(
@@ -30,6 +32,21 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Poison pill for queues where None could be a real work item
+_SENTINEL = object()
+
+
+def _drain(sink: queue.SimpleQueue) -> List[Any]:
+    """
+    Collect everything the workers put on a result sink.
+
+    Call only after the workers have been joined. Workers put results
+    on a SimpleQueue (implemented in C) instead of appending to a shared
+    list under one lock, so consumers never queue up behind each other;
+    the queue also keeps results in completion order.
+    """
+    return [sink.get_nowait() for _ in range(sink.qsize())]
+
 
 def producer_consumer_basic(
     items: list,
@@ -43,11 +60,17 @@ def producer_consumer_basic(
     Producer puts items into the queue; consumers pull and process them.
     queue.Queue is thread-safe — no manual locking needed.
 
+    With an unbounded queue (the default) there is nothing to throttle —
+    every item already exists — so the work is loaded into a deque up
+    front and consumers drain it with deque.popleft(), which is atomic
+    in C, skipping queue.Queue's per-operation lock and condition.
+
     Args:
         items: Items for producer to enqueue
         process_func: Function each consumer applies to items
         num_consumers: Number of consumer threads
-        queue_size: Max queue size (0 = unlimited)
+        queue_size: Max queue size (0 = unlimited); a bound makes the
+                    producer wait for consumers (backpressure)
 
     Returns:
         List of processed results
@@ -61,9 +84,38 @@ def producer_consumer_basic(
            The queue acts as a shock absorber between fast producers
            and slow consumers.
     """
+    results = queue.SimpleQueue()
+
+    if queue_size == 0:
+        # All work plus one poison pill per consumer, before any consumer
+        # starts — the deque is never empty while a consumer is running
+        work = deque(items)
+        work.extend([None] * num_consumers)
+
+        def drain_consumer():
+            """Consumer thread — pops work until poison pill."""
+            while True:
+                item = work.popleft()
+                if item is None:
+                    break
+
+                try:
+                    results.put(process_func(item))
+                except Exception as e:
+                    logger.error(f"Consumer error: {e}")
+
+        consumers = [
+            threading.Thread(target=drain_consumer, name=f"consumer-{i}")
+            for i in range(num_consumers)
+        ]
+        for t in consumers:
+            t.start()
+        for t in consumers:
+            t.join()
+
+        return _drain(results)
+
     work_queue = queue.Queue(maxsize=queue_size)
-    results = []
-    results_lock = threading.Lock()
 
     def consumer():
         """Consumer thread — pulls work from queue until poison pill."""
@@ -75,9 +127,7 @@ def producer_consumer_basic(
                 break
 
             try:
-                result = process_func(item)
-                with results_lock:
-                    results.append(result)
+                results.put(process_func(item))
             except Exception as e:
                 logger.error(f"Consumer error: {e}")
             finally:
@@ -106,7 +156,7 @@ def producer_consumer_basic(
     for t in consumers:
         t.join()
 
-    return results
+    return _drain(results)
 
 
 def priority_queue_processor(
@@ -115,11 +165,19 @@ def priority_queue_processor(
     num_workers: int = 3
 ) -> List[Dict[str, Any]]:
     """
-    Process tasks by priority using PriorityQueue.
+    Process tasks by priority with a single-owner heap.
 
     Higher priority tasks (lower number) are processed first.
     Useful for handling critical alerts before routine maintenance.
 
+    Instead of N workers contending for one locked PriorityQueue, the
+    calling thread owns a plain heapq heap (no lock needed). Idle
+    workers post their id on a shared ready queue; the dispatcher pops
+    the heap only then, onto that worker's own SimpleQueue. Tasks are
+    handed out one at a time on demand, so the next task started is
+    always the highest-priority one left — a worker stuck on a slow
+    task never sits on queued urgent work.
+
     Args:
         tasks: List of dicts with 'priority' (int) and 'data' fields
         process_func: Function to process each task's data
@@ -135,48 +193,107 @@ def priority_queue_processor(
            starvation (increment priority of old jobs). Support priority
            inversion detection for dependent jobs.
     """
-    pq = queue.PriorityQueue()
-    results = []
-    results_lock = threading.Lock()
-    counter = 0  # Tie-breaker for equal priorities
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1, got {num_workers}")
 
-    def worker():
+    results = queue.SimpleQueue()
+    worker_queues = [queue.SimpleQueue() for _ in range(num_workers)]
+    # Ids of workers waiting for their next task
+    ready = queue.SimpleQueue()
+
+    # Index is the tie-breaker for equal priorities (keeps FIFO order)
+    heap = [(task['priority'], idx, task['data']) for idx, task in enumerate(tasks)]
+    heapq.heapify(heap)
+
+    def worker(worker_id: int):
+        my_queue = worker_queues[worker_id]
         while True:
-            try:
-                priority, idx, task_data = pq.get(timeout=2.0)
-                try:
-                    result = process_func(task_data)
-                    with results_lock:
-                        results.append({
-                            'priority': priority,
-                            'data': task_data,
-                            'result': result
-                        })
-                except Exception as e:
-                    logger.error(f"Worker error: {e}")
-                finally:
-                    pq.task_done()
-            except queue.Empty:
+            # Ask for work only when idle — keeps dispatch in priority order
+            ready.put(worker_id)
+            item = my_queue.get()
+            if item is _SENTINEL:
                 break
 
-    # Enqueue tasks with priority
-    for task in tasks:
-        pq.put((task['priority'], counter, task['data']))
-        counter += 1
+            priority, idx, task_data = item
+            try:
+                result = process_func(task_data)
+                results.put({
+                    'priority': priority,
+                    'data': task_data,
+                    'result': result
+                })
+            except Exception as e:
+                logger.error(f"Worker error: {e}")
 
     # Start workers
     workers = []
     for i in range(num_workers):
-        t = threading.Thread(target=worker, name=f"worker-{i}")
+        t = threading.Thread(target=worker, args=(i,), name=f"worker-{i}")
         t.start()
         workers.append(t)
 
+    # Dispatch in priority order, one task to whichever worker is idle
+    while heap:
+        worker_queues[ready.get()].put(heapq.heappop(heap))
+
+    # Poison pills — every worker asks once more after its last task
+    for _ in range(num_workers):
+        worker_queues[ready.get()].put(_SENTINEL)
+
     # Wait for completion
-    pq.join()
     for t in workers:
         t.join()
 
-    return results
+    return _drain(results)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket, shared by every worker that must obey one limit.
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    each call takes one. Callers block only while the bucket is empty.
+    Uses time.monotonic() so wall-clock jumps (NTP) can't skew the rate.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Args:
+            rate: Tokens added per second (the sustained call rate)
+            capacity: Maximum tokens held — the largest allowed burst
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def take(self, n: float = 1.0) -> None:
+        """
+        Block until n tokens are available, then consume them.
+
+        Raises:
+            ValueError: If n exceeds capacity (it could never be satisfied)
+        """
+        if n > self.capacity:
+            raise ValueError(
+                f"cannot take {n} tokens from a bucket of capacity {self.capacity}"
+            )
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= n:
+                    self.tokens -= n
+                    return
+                deficit = n - self.tokens
+            # Sleep without the lock so other workers can check the bucket
+            time.sleep(deficit / self.rate)
 
 
 def rate_limited_queue(
@@ -189,12 +306,14 @@ def rate_limited_queue(
     Process items through a rate-limited queue.
 
     Ensures we don't exceed API rate limits by controlling
-    how fast items are dispatched from the queue.
+    how fast items are dispatched from the queue. All workers draw
+    from one TokenBucket, so the limit holds for the whole pool —
+    adding workers adds concurrency, not extra calls per second.
 
     Args:
         items: Items to process
         process_func: Processing function
-        calls_per_second: Maximum calls per second
+        calls_per_second: Maximum calls per second (across all workers)
         num_workers: Number of worker threads
 
     Returns:
@@ -209,9 +328,8 @@ def rate_limited_queue(
            5. Distribute calls across multiple API keys/regions
     """
     work_queue = queue.Queue()
-    results = []
-    results_lock = threading.Lock()
-    min_interval = 1.0 / calls_per_second
+    results = queue.SimpleQueue()
+    bucket = TokenBucket(rate=calls_per_second)
 
     def worker():
         while True:
@@ -220,19 +338,13 @@ def rate_limited_queue(
                 work_queue.task_done()
                 break
 
-            start = time.time()
+            # Wait for a token before the call, not a sleep after it
+            bucket.take()
             try:
-                result = process_func(item)
-                with results_lock:
-                    results.append(result)
+                results.put(process_func(item))
             except Exception as e:
                 logger.error(f"Rate-limited worker error: {e}")
             finally:
-                # Enforce rate limit by sleeping for remaining interval
-                elapsed = time.time() - start
-                sleep_time = max(0, min_interval - elapsed)
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
                 work_queue.task_done()
 
     # Start workers
@@ -254,7 +366,7 @@ def rate_limited_queue(
     for t in workers:
         t.join()
 
-    return results
+    return _drain(results)
 
 
 # ============================================================
@@ -300,13 +412,13 @@ if __name__ == "__main__":
     print("\n--- Example 3: Rate-Limited Queue ---")
     api_calls = [f"api-call-{i}" for i in range(5)]
 
-    start = time.time()
+    start = time.perf_counter()
     rl_results = rate_limited_queue(
         api_calls,
         lambda x: f"Response for {x}",
         calls_per_second=10.0,
         num_workers=1
     )
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     print(f"  Processed {len(rl_results)} calls in {elapsed:.2f}s "
           f"(rate limited to 10/s)")
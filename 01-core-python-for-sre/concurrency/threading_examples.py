@@ -16,13 +16,27 @@ Production Use Cases:
 
 Prerequisites:
 - No external packages needed (stdlib only)
+- requests (pip install requests) — optional, parallel_api_calls simulates without it
 """
 
+import sys
 import time
+import inspect
 import logging
 import threading
-from typing import List, Dict, Any, Callable, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Callable, Literal, Optional, Type
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+# Pool-sizing helpers shared with the other concurrency examples
+from _pool_sizing import available_cpus
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    _HAS_REQUESTS = True
+except ImportError:
+    requests = None
+    _HAS_REQUESTS = False
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +44,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Monotonic, integer-nanosecond clock for durations — immune to NTP
+# adjustments; convert to seconds only when reporting
+_now = time.perf_counter_ns
+
 
 def run_tasks_with_threads(
     tasks: List[Callable],
@@ -40,7 +58,8 @@ def run_tasks_with_threads(
     Run multiple tasks concurrently using a thread pool.
 
     Uses ThreadPoolExecutor for managed thread lifecycle.
-    Results are collected as they complete (not in submission order).
+    Results are collected as they complete and stored by submission
+    index, so the returned list is in submission order.
 
     Args:
         tasks: List of callable functions (no arguments)
@@ -57,8 +76,9 @@ def run_tasks_with_threads(
            libraries or need very high concurrency (1000s of connections).
            Threading has higher overhead per "task" but works with any library.
     """
-    results = []
-    start_time = time.time()
+    # Pre-allocate — each result lands at its submission index
+    results = [None] * len(tasks)
+    start_ns = _now()
 
     # ThreadPoolExecutor manages a pool of worker threads
     # 'with' ensures proper cleanup when done
@@ -72,33 +92,178 @@ def run_tasks_with_threads(
         # Collect results as they complete
         for future in as_completed(future_to_index, timeout=timeout):
             index = future_to_index[future]
-            task_start = time.time()
 
             try:
                 result = future.result()
-                results.append({
+                results[index] = {
+                    'index': index,
+                    'status': 'success',
+                    'result': result,
+                    'duration': round((_now() - start_ns) / 1e9, 3)
+                }
+            except Exception as e:
+                results[index] = {
+                    'index': index,
+                    'status': 'error',
+                    'error': str(e),
+                    'error_type': type(e).__name__,
+                    'duration': round((_now() - start_ns) / 1e9, 3)
+                }
+
+    return results
+
+
+def _check_picklable_task(task: Callable) -> None:
+    """
+    Reject callables a process pool can't send to its workers.
+
+    Functions are pickled by reference (module + qualified name), so
+    lambdas and functions defined inside another function fail — and
+    only when the worker tries to load them, with a confusing error.
+    """
+    if inspect.isfunction(task) and (
+        '<lambda>' in task.__qualname__ or '<locals>' in task.__qualname__
+    ):
+        raise ValueError(
+            f"Task {task.__qualname__!r} can't be pickled for a process pool: "
+            f"define it at module level (use functools.partial to bind arguments)"
+        )
+
+
+def run_tasks_with_processes(
+    tasks: List[Callable],
+    max_workers: int = None,
+    timeout: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Run multiple CPU-bound tasks in parallel using a process pool.
+
+    The process counterpart of run_tasks_with_threads: each worker is a
+    separate interpreter with its own GIL, so pure-Python computation
+    runs on all cores instead of taking turns on one.
+
+    Args:
+        tasks: List of module-level callables (no arguments) — lambdas
+               and nested functions can't be pickled
+        max_workers: Maximum worker processes (default: CPU count)
+        timeout: Overall timeout for all tasks
+
+    Returns:
+        List of result dictionaries with status, result/error, and timing
+
+    Raises:
+        ValueError: If a task is a lambda or nested function
+    """
+    for task in tasks:
+        _check_picklable_task(task)
+
+    # Pre-allocate — each result lands at its submission index
+    results = [None] * len(tasks)
+    start_ns = _now()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        future_to_index = {
+            executor.submit(task): i
+            for i, task in enumerate(tasks)
+        }
+
+        for future in as_completed(future_to_index, timeout=timeout):
+            index = future_to_index[future]
+
+            try:
+                result = future.result()
+                results[index] = {
                     'index': index,
                     'status': 'success',
                     'result': result,
-                    'duration': round(time.time() - start_time, 3)
-                })
+                    'duration': round((_now() - start_ns) / 1e9, 3)
+                }
             except Exception as e:
-                results.append({
+                results[index] = {
                     'index': index,
                     'status': 'error',
                     'error': str(e),
                     'error_type': type(e).__name__,
-                    'duration': round(time.time() - start_time, 3)
-                })
+                    'duration': round((_now() - start_ns) / 1e9, 3)
+                }
 
-    # Sort by original submission order
-    results.sort(key=lambda r: r['index'])
     return results
 
 
+def choose_executor(workload: Literal["io", "cpu"]) -> Type[Executor]:
+    """
+    Pick the executor class for a workload.
+
+    Args:
+        workload: "io" for network/disk-bound work, "cpu" for computation
+
+    Returns:
+        ProcessPoolExecutor for CPU-bound work, ThreadPoolExecutor for I/O
+
+    Interview Question:
+        Q: Why not just use threads for everything?
+        A: Only one thread runs Python bytecode at a time (the GIL).
+           I/O releases it, so threads overlap waiting just fine; pure-Python
+           computation doesn't, so CPU-bound threads take turns on one core.
+           Processes sidestep the GIL at the cost of pickling inputs/results.
+    """
+    return ProcessPoolExecutor if workload == "cpu" else ThreadPoolExecutor
+
+
+def _gil_enabled() -> bool:
+    """False only on a free-threaded (PEP 703) build running without the GIL."""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)  # Python 3.13+
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+def _default_workers_for_io() -> int:
+    """
+    Default thread count for I/O-bound fan-out.
+
+    With the GIL, response parsing is serialized, so more than ~10
+    threads mostly adds contention. Without it (free-threaded build)
+    threads parse in parallel too, and context switches are the limit.
+    """
+    if not _gil_enabled():
+        return available_cpus() * 8
+    return 10
+
+
+# Shared HTTP session — keeps TCP/TLS connections alive across calls
+_http_session = None
+_http_pool_size = 0
+# Guards the check-and-rebuild so concurrent callers can't race it
+_http_session_lock = threading.Lock()
+
+
+def _get_http_session(pool_size: int):
+    """
+    Return the shared requests Session, with a pool of at least pool_size.
+
+    Every worker thread reuses pooled connections instead of paying a new
+    TCP (and TLS) handshake per request, which module-level requests.get()
+    does. The session is rebuilt only if a caller needs a bigger pool;
+    the replaced one is closed so its pooled connections aren't leaked.
+    """
+    global _http_session, _http_pool_size
+    with _http_session_lock:
+        if _http_session is None or _http_pool_size < pool_size:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            old_session = _http_session
+            _http_session, _http_pool_size = session, pool_size
+            if old_session is not None:
+                # Drops idle pooled connections; requests already in
+                # flight on it still complete
+                old_session.close()
+        return _http_session
+
+
 def parallel_api_calls(
     urls: List[str],
-    max_workers: int = 10,
+    max_workers: Optional[int] = None,
     timeout: float = 30.0
 ) -> List[Dict[str, Any]]:
     """
@@ -106,7 +271,8 @@ def parallel_api_calls(
 
     Args:
         urls: List of URLs to fetch
-        max_workers: Maximum concurrent requests
+        max_workers: Maximum concurrent requests (default: 10, or
+                     8 per CPU on a free-threaded build without the GIL)
         timeout: Per-request timeout
 
     Returns:
@@ -120,23 +286,32 @@ def parallel_api_calls(
            so threading works great for I/O-bound tasks. For CPU-bound work,
            use multiprocessing instead (each process has its own GIL).
     """
+    if max_workers is None:
+        max_workers = _default_workers_for_io()
+    logger.info(
+        f"Fetching {len(urls)} URLs with {max_workers} threads "
+        f"(GIL {'enabled' if _gil_enabled() else 'disabled'})"
+    )
+
+    session = _get_http_session(max_workers) if _HAS_REQUESTS else None
+
     def _fetch(url: str) -> Dict[str, Any]:
         """Fetch a single URL (blocking call)."""
+        if session is None:
+            # Simulate if requests not installed
+            time.sleep(0.05)
+            return {'url': url, 'status_code': 200, 'success': True, 'simulated': True}
+
         try:
-            import requests
-            start = time.time()
-            resp = requests.get(url, timeout=timeout)
-            elapsed = time.time() - start
+            start_ns = _now()
+            resp = session.get(url, timeout=timeout)
+            elapsed_ns = _now() - start_ns
             return {
                 'url': url,
                 'status_code': resp.status_code,
-                'response_time': round(elapsed, 3),
+                'response_time': round(elapsed_ns / 1e9, 3),
                 'success': True
             }
-        except ImportError:
-            # Simulate if requests not installed
-            time.sleep(0.05)
-            return {'url': url, 'status_code': 200, 'success': True, 'simulated': True}
         except Exception as e:
             return {'url': url, 'error': str(e), 'success': False}
 
@@ -176,10 +351,16 @@ def thread_safe_counter():
 
     def increment_safe():
         """Thread-safe increment using a Lock."""
+        # Count privately, then publish once: one lock round-trip per
+        # thread instead of one per increment. Lock cost matters even
+        # more on free-threaded (no-GIL) builds, where it is the only
+        # thing serializing the threads
+        local = 0
         for _ in range(10000):
-            with lock:
-                # Only one thread can be in this block at a time
-                counter['value'] += 1
+            local += 1
+        with lock:
+            # Only one thread can be in this block at a time
+            counter['value'] += local
 
     return increment_safe, increment_unsafe, counter, lock
 
@@ -203,9 +384,9 @@ if __name__ == "__main__":
 
     tasks = [lambda sid=i: simulate_api_call(sid) for i in range(8)]
 
-    start = time.time()
+    start_ns = _now()
     results = run_tasks_with_threads(tasks, max_workers=4)
-    elapsed = time.time() - start
+    elapsed = (_now() - start_ns) / 1e9
 
     for r in results:
         status = "✓" if r['status'] == 'success' else "✗"
@@ -17,7 +17,9 @@ Prerequisites:
 - No external packages needed (stdlib only)
 """
 
+import sys
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Callable, Optional
 from abc import ABC, abstractmethod
 
@@ -60,59 +62,92 @@ def create_cloud_client(
            3. You want to swap implementations without changing callers
            4. Testing — inject mock factories for unit tests
     """
-    factories = {
-        'aws': _create_aws_client,
-        'gcp': _create_gcp_client,
-        'azure': _create_azure_client,
-    }
-
-    provider_lower = provider.lower()
-    if provider_lower not in factories:
+    # One lookup; skip the .lower() copy when the name is already lowercase
+    factory = _FACTORIES.get(provider if provider.islower() else provider.lower())
+    if factory is None:
         raise ValueError(
             f"Unknown provider: {provider}. "
-            f"Supported: {list(factories.keys())}"
+            f"Supported: {list(_FACTORIES)}"
         )
 
-    client = factories[provider_lower](region=region, **kwargs)
-    logger.info(f"Created {provider} client for region {region}")
+    client = factory(region, **kwargs)
+    # %-style args: formatted only if INFO is enabled (this runs per call)
+    logger.info("Created %s client for region %s", provider, region)
     return client
 
 
-def _create_aws_client(region: str, **kwargs) -> Dict[str, Any]:
+@lru_cache(maxsize=64)
+def _aws_endpoint(region: str) -> str:
+    """EC2 endpoint for a region — built once per region, then reused."""
+    return f'https://ec2.{region}.amazonaws.com'
+
+
+# Each factory returns one flat dict literal with its constants inline —
+# CPython builds that in a single step, cheaper than merging a shared
+# base dict ({**base, ...}) — and a fresh dict per call that callers may mutate.
+# Options are keyword-only parameters with their defaults in the signature,
+# so there's no kwargs.get() per option; options meant for another provider
+# land in **_ignored, keeping create_cloud_client() provider-agnostic.
+def _create_aws_client(
+    region: str,
+    *,
+    auth_method: str = 'iam_role',
+    **_ignored
+) -> Dict[str, Any]:
     """Create AWS client configuration."""
     return {
         'provider': 'aws',
         'region': region,
-        'service_endpoint': f'https://ec2.{region}.amazonaws.com',
-        'auth_method': kwargs.get('auth_method', 'iam_role'),
+        'service_endpoint': _aws_endpoint(region),
+        'auth_method': auth_method,
         'sdk': 'boto3',
     }
 
 
-def _create_gcp_client(region: str, **kwargs) -> Dict[str, Any]:
+def _create_gcp_client(
+    region: str,
+    *,
+    project_id: str = 'default-project',
+    auth_method: str = 'service_account',
+    **_ignored
+) -> Dict[str, Any]:
     """Create GCP client configuration."""
     return {
         'provider': 'gcp',
         'region': region,
-        'project_id': kwargs.get('project_id', 'default-project'),
-        'service_endpoint': f'https://compute.googleapis.com',
-        'auth_method': kwargs.get('auth_method', 'service_account'),
+        'project_id': project_id,
+        'service_endpoint': 'https://compute.googleapis.com',
+        'auth_method': auth_method,
         'sdk': 'google-cloud-compute',
     }
 
 
-def _create_azure_client(region: str, **kwargs) -> Dict[str, Any]:
+def _create_azure_client(
+    region: str,
+    *,
+    subscription_id: str = '',
+    auth_method: str = 'managed_identity',
+    **_ignored
+) -> Dict[str, Any]:
     """Create Azure client configuration."""
     return {
         'provider': 'azure',
         'region': region,
-        'subscription_id': kwargs.get('subscription_id', ''),
-        'service_endpoint': f'https://management.azure.com',
-        'auth_method': kwargs.get('auth_method', 'managed_identity'),
+        'subscription_id': subscription_id,
+        'service_endpoint': 'https://management.azure.com',
+        'auth_method': auth_method,
         'sdk': 'azure-mgmt-compute',
     }
 
 
+# Built once at import time, not on every create_cloud_client() call
+_FACTORIES: Dict[str, Callable[..., Dict[str, Any]]] = {
+    'aws': _create_aws_client,
+    'gcp': _create_gcp_client,
+    'azure': _create_azure_client,
+}
+
+
 # ============================================================
 # Approach 2: Registry-based factory (extensible)
 # ============================================================
@@ -134,7 +169,8 @@ def register_notification_handler(channel: str) -> Callable:
             ...
     """
     def decorator(func: Callable) -> Callable:
-        _notification_registry[channel] = func
+        # Interned keys let literal channel names hit dict's identity fast path
+        _notification_registry[sys.intern(channel)] = func
         logger.info(f"Registered notification handler: {channel}")
         return func
     return decorator
@@ -152,11 +188,11 @@ def send_notification(channel: str, message: str, **kwargs) -> bool:
     Returns:
         True if sent successfully
     """
-    if channel not in _notification_registry:
-        logger.error(f"No handler registered for channel: {channel}")
+    handler = _notification_registry.get(channel)
+    if handler is None:
+        logger.error("No handler registered for channel: %s", channel)
         return False
 
-    handler = _notification_registry[channel]
     return handler(message, **kwargs)
 
 
@@ -18,10 +18,16 @@ Prerequisites:
 - No external packages needed (stdlib only)
 """
 
+import bisect
+import heapq
 import logging
+import itertools
+import threading
 import time
-from typing import Callable, Dict, List, Any, Optional
-from datetime import datetime
+from collections import defaultdict, deque
+from typing import Callable, DefaultDict, Deque, Dict, Iterable, List, Any, Optional, Sequence, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timezone
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +36,50 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _format_ts(ns: int) -> str:
+    """Render an epoch-nanosecond timestamp as ISO-8601 UTC ('...Z')."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class Event:
+    """
+    One published event.
+
+    __slots__ instead of a dict: about 56 bytes per event rather than
+    184, which is what a full history buffer holds on to. Subscribers
+    read event.type / event.data / event.timestamp (epoch ns);
+    event['data']-style access still works for existing subscribers.
+    """
+    __slots__ = ('type', 'data', 'timestamp')
+
+    def __init__(self, event_type: str, data: Dict[str, Any], timestamp: int):
+        self.type = event_type
+        self.data = data
+        self.timestamp = timestamp
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __repr__(self) -> str:
+        return f"Event(type={self.type!r}, data={self.data!r}, timestamp={self.timestamp})"
+
+
+# (priority, seq, callback, name) — sorts by priority, then subscription
+# order; name is resolved once at subscribe time for log messages
+_Subscription = Tuple[int, int, Callable, str]
+
+
+def _remove_subscription(subscribers: List[_Subscription], callback: Callable) -> None:
+    """Remove callback's entry, if present; an unknown callback is a no-op."""
+    for i, (_, _, cb, _) in enumerate(subscribers):
+        if cb == callback:
+            del subscribers[i]
+            return
+
+
 class EventBus:
     """
     Simple event bus implementing the observer pattern.
@@ -46,81 +96,331 @@ class EventBus:
            infrastructure changes (resource created → audit, tag, monitor).
     """
 
-    def __init__(self):
-        # Map event_type → list of subscriber callbacks
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._event_history: List[Dict[str, Any]] = []
-
-    def subscribe(self, event_type: str, callback: Callable) -> None:
+    def __init__(
+        self,
+        history_size: int = 10_000,
+        max_workers: int = 8,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        """
+        Args:
+            history_size: Most recent events kept for get_history();
+                          older events are dropped so memory stays bounded
+            max_workers: Threads used by publish(parallel=True); the pool
+                         is only started the first time it is needed
+            executor: Existing pool to run parallel subscribers on (left
+                      running by close()); if None, the bus creates its own
+        """
+        # Map event_type → (priority, seq, callback, name) entries, kept sorted
+        # at subscribe time so publish just walks them in order
+        self._subscribers: DefaultDict[str, List[_Subscription]] = defaultdict(list)
+        # '*' subscribers get their own list, so publish never has to
+        # build a combined list
+        self._wildcards: List[_Subscription] = []
+        # 'deployment.*' style patterns, keyed by their prefix segments
+        # ('deployment',) — publish probes one key per level of the event
+        # type instead of matching every pattern
+        self._prefix_subs: DefaultDict[Tuple[str, ...], List[_Subscription]] = defaultdict(list)
+        # Tie-breaker: equal priorities run in subscription order, and
+        # callbacks themselves are never compared
+        self._seq = itertools.count()
+        # Ring buffer — O(1) append, oldest event falls off when full
+        self._event_history: Deque[Event] = deque(maxlen=history_size)
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = executor
+        self._owns_pool = executor is None
+        self._pool_lock = threading.Lock()
+
+    def subscribe(self, event_type: str, callback: Callable, priority: int = 100) -> None:
         """
         Register a callback for a specific event type.
 
         Args:
-            event_type: Event type string (e.g., 'alert.critical')
+            event_type: Event type string (e.g., 'alert.critical'), a
+                        prefix pattern ('deployment.*' matches
+                        'deployment.started', 'deployment.canary.done'),
+                        or '*' for every event
             callback: Function to call when event fires.
-                     Receives event_data dict as argument.
+                     Receives the Event as its argument.
+            priority: Lower runs first among subscribers of the same
+                      event type or pattern (e.g. page PagerDuty before
+                      posting to Slack); equal priorities run in
+                      subscription order
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-
-        self._subscribers[event_type].append(callback)
+        if event_type == '*':
+            subscribers = self._wildcards
+        elif event_type.endswith('.*'):
+            subscribers = self._prefix_subs[tuple(event_type[:-2].split('.'))]
+        else:
+            subscribers = self._subscribers[event_type]
+        # partials and callable objects have no __name__
+        name = getattr(callback, '__name__', None) or repr(callback)
+        # O(log N) search at subscribe time instead of sorting per publish
+        bisect.insort(subscribers, (priority, next(self._seq), callback, name))
         logger.info(
-            f"Subscribed '{callback.__name__}' to '{event_type}' "
-            f"(total: {len(self._subscribers[event_type])} subscribers)"
+            f"Subscribed '{name}' to '{event_type}' "
+            f"(total: {len(subscribers)} subscribers)"
         )
 
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
-        """Remove a subscriber from an event type."""
-        if event_type in self._subscribers:
-            self._subscribers[event_type].remove(callback)
+        """
+        Remove a subscriber from an event type.
+
+        Removing a callback that isn't subscribed — under an exact type,
+        a 'prefix.*' pattern or '*' — is a silent no-op, so cleanup code
+        can unsubscribe unconditionally.
 
-    def publish(self, event_type: str, data: Optional[Dict[str, Any]] = None) -> int:
+        A key whose last subscriber is removed is dropped entirely, so
+        publish's "nobody is listening" early return keeps working
+        after subscribers come and go.
+        """
+        if event_type == '*':
+            _remove_subscription(self._wildcards, callback)
+            return
+
+        if event_type.endswith('.*'):
+            index, key = self._prefix_subs, tuple(event_type[:-2].split('.'))
+        else:
+            index, key = self._subscribers, event_type
+
+        subscribers = index.get(key)
+        if subscribers is not None:
+            _remove_subscription(subscribers, callback)
+            if not subscribers:
+                del index[key]
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """Shared subscriber pool, created on first parallel publish."""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix='eventbus'
+                    )
+        return self._pool
+
+    def _notify(self, callback: Callable, name: str, event: Event) -> bool:
+        """Run one subscriber; a failure is logged, never propagated."""
+        try:
+            callback(event)
+            return True
+        except Exception as e:
+            # Don't let one subscriber failure affect others
+            logger.error(
+                "Subscriber '%s' failed for '%s': %s",
+                name, event.type, e
+            )
+            return False
+
+    def publish(
+        self,
+        event_type: str,
+        data: Optional[Dict[str, Any]] = None,
+        parallel: bool = False,
+        sync: bool = True,
+        timeout: Optional[float] = None
+    ) -> int:
         """
         Publish an event to all subscribers.
 
+        By default subscribers run one after another in the caller's
+        thread — cheapest when they are quick. With parallel=True each
+        subscriber runs on the bus's thread pool, so a slow Slack webhook
+        no longer holds up the PagerDuty page.
+
         Args:
             event_type: Type of event
             data: Event payload
+            parallel: Run subscribers concurrently on the shared thread pool
+            sync: With parallel, wait for subscribers to finish; if False,
+                  return immediately (fire-and-forget — failures are
+                  still logged)
+            timeout: With parallel and sync, max seconds to wait; a
+                     subscriber still running then is not counted
 
         Returns:
-            Number of subscribers notified
+            Number of subscribers notified (with parallel and not sync,
+            the number dispatched)
         """
-        event = {
-            'type': event_type,
-            'data': data or {},
-            'timestamp': datetime.utcnow().isoformat() + 'Z'
-        }
+        # Epoch ns int — no datetime/str per event; format with _format_ts()
+        event = Event(event_type, data or {}, time.time_ns())
 
         self._event_history.append(event)
+        return self._deliver((event,), parallel, sync, timeout)
+
+    def publish_many(
+        self,
+        batch: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+        parallel: bool = False,
+        sync: bool = True,
+        timeout: Optional[float] = None
+    ) -> int:
+        """
+        Publish a burst of events in one call.
 
-        subscribers = self._subscribers.get(event_type, [])
-        # Also notify wildcard subscribers
-        wildcard_subs = self._subscribers.get('*', [])
-        all_subscribers = subscribers + wildcard_subs
+        The events share one timestamp, go into history with a single
+        extend(), and — with parallel and sync — are all in flight at
+        once with one wait for the whole batch instead of one per event.
 
-        if not all_subscribers:
-            logger.debug(f"No subscribers for event '{event_type}'")
-            return 0
+        Args:
+            batch: (event_type, data) pairs, in publish order
+            parallel, sync, timeout: As for publish()
+
+        Returns:
+            Total number of subscriber notifications across the batch
+        """
+        now = time.time_ns()
+        events = [
+            Event(event_type, data or {}, now)
+            for event_type, data in batch
+        ]
+        self._event_history.extend(events)
+        return self._deliver(events, parallel, sync, timeout)
+
+    def _matching(self, event_type: str) -> List[Sequence[_Subscription]]:
+        """Subscriber groups for an event type, or [] if nobody listens."""
+        # .get() rather than [] — publishing must not create empty entries
+        subscribers = self._subscribers.get(event_type, ())
+
+        # Events nobody listens to stop here — no prefix walk, no group list.
+        # Relies on unsubscribe() pruning emptied keys from _prefix_subs
+        if not subscribers and not self._prefix_subs and not self._wildcards:
+            # %-style args: nothing is formatted unless DEBUG is on
+            logger.debug("No subscribers for event '%s'", event_type)
+            return []
+
+        # Exact-match subscribers first, then prefix patterns from the most
+        # specific down, then wildcard subscribers
+        groups = [subscribers]
+        if self._prefix_subs:
+            segments = event_type.split('.')
+            for depth in range(len(segments) - 1, 0, -1):
+                matched = self._prefix_subs.get(tuple(segments[:depth]))
+                if matched:
+                    groups.append(matched)
+        groups.append(self._wildcards)
+        return groups
+
+    def _deliver(
+        self,
+        events: Sequence[Event],
+        parallel: bool,
+        sync: bool,
+        timeout: Optional[float]
+    ) -> int:
+        """Notify every matching subscriber of each event, in order."""
+        if parallel:
+            executor = self._executor()
+            futures = [
+                executor.submit(self._notify, callback, name, event)
+                for event in events
+                for group in self._matching(event.type)
+                for _, _, callback, name in group
+            ]
+            if not sync:
+                return len(futures)
+            done, _ = wait(futures, timeout=timeout)
+            return sum(1 for f in done if f.result())
 
         notified = 0
-        for callback in all_subscribers:
-            try:
-                callback(event)
-                notified += 1
-            except Exception as e:
-                # Don't let one subscriber failure affect others
-                logger.error(
-                    f"Subscriber '{callback.__name__}' failed for "
-                    f"'{event_type}': {e}"
-                )
+        for event in events:
+            for group in self._matching(event.type):
+                for _, _, callback, name in group:
+                    if self._notify(callback, name, event):
+                        notified += 1
 
         return notified
 
-    def get_history(self, event_type: Optional[str] = None) -> List[Dict]:
-        """Get event history, optionally filtered by type."""
-        if event_type:
-            return [e for e in self._event_history if e['type'] == event_type]
-        return self._event_history.copy()
+    def close(self) -> None:
+        """Shut down the subscriber thread pool, if this bus started one."""
+        if self._pool is not None and self._owns_pool:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def get_history(self, event_type: Optional[str] = None) -> List[Event]:
+        """Get the retained event history (a snapshot), optionally filtered by type."""
+        return [e for e in self._event_history if event_type is None or e.type == event_type]
+
+
+class ShardedEventBus:
+    """
+    EventBus split into independent shards by top-level event segment.
+
+    Producers publishing 'build.*' and 'alert.*' events touch different
+    subscriber tables and history buffers. On a free-threaded build
+    (3.13t) that keeps producer threads off each other's per-object
+    locks; with the GIL there is no lock to split, so prefer a plain
+    EventBus there.
+
+    Everything matching an event lives in its shard: exact types and
+    'prefix.*' patterns share the event's first segment. '*' subscribers
+    are registered on every shard. All shards run parallel subscribers
+    on one shared thread pool.
+
+    Interview Question:
+        Q: How do you scale a pub/sub hub across many producer threads?
+        A: Remove the single point of contention — partition state by
+           key (topic, prefix) so unrelated producers never share it,
+           the same idea as per-CPU run queues or Kafka partitions.
+           Cross-partition views (a global history) are merged on read.
+    """
+
+    def __init__(self, shards: int = 8, history_size: int = 10_000, max_workers: int = 8):
+        """
+        Args:
+            shards: Number of independent shards
+            history_size: Total events kept, split evenly across shards
+            max_workers: Threads in the pool shared by all shards
+        """
+        # Creating the executor doesn't start threads — they spawn on first submit
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='eventbus')
+        per_shard = max(1, history_size // shards)
+        self._shards = [
+            EventBus(history_size=per_shard, executor=self._pool) for _ in range(shards)
+        ]
+
+    def _shard(self, event_type: str) -> EventBus:
+        """The shard owning every event and pattern under event_type's first segment."""
+        return self._shards[hash(event_type.partition('.')[0]) % len(self._shards)]
+
+    def subscribe(self, event_type: str, callback: Callable, priority: int = 100) -> None:
+        """Register a callback; same arguments as EventBus.subscribe."""
+        if event_type == '*':
+            for shard in self._shards:
+                shard.subscribe(event_type, callback, priority)
+        else:
+            self._shard(event_type).subscribe(event_type, callback, priority)
+
+    def unsubscribe(self, event_type: str, callback: Callable) -> None:
+        """
+        Remove a subscriber; same arguments as EventBus.unsubscribe.
+
+        '*' is registered on every shard, so it is removed from each; like
+        any other key, an unknown callback is a no-op.
+        """
+        if event_type == '*':
+            for shard in self._shards:
+                shard.unsubscribe(event_type, callback)
+        else:
+            self._shard(event_type).unsubscribe(event_type, callback)
+
+    def publish(self, event_type: str, data: Optional[Dict[str, Any]] = None, **options) -> int:
+        """Publish to the owning shard; options as for EventBus.publish."""
+        return self._shard(event_type).publish(event_type, data, **options)
+
+    def get_history(self, event_type: Optional[str] = None) -> List[Event]:
+        """Retained history across all shards, merged by timestamp."""
+        if event_type is not None:
+            return self._shard(event_type).get_history(event_type)
+        return list(heapq.merge(
+            *(shard.get_history() for shard in self._shards),
+            key=lambda e: e.timestamp
+        ))
+
+    def close(self) -> None:
+        """Shut down the shared subscriber thread pool."""
+        self._pool.shutdown(wait=True)
 
 
 def create_monitoring_event_bus() -> EventBus:
@@ -132,23 +432,23 @@ def create_monitoring_event_bus() -> EventBus:
     """
     bus = EventBus()
 
-    def slack_notifier(event: Dict):
-        severity = event['data'].get('severity', 'info')
-        message = event['data'].get('message', 'No message')
+    def slack_notifier(event: Event):
+        severity = event.data.get('severity', 'info')
+        message = event.data.get('message', 'No message')
         print(f"  📨 [Slack] [{severity.upper()}] {message}")
 
-    def pagerduty_handler(event: Dict):
-        severity = event['data'].get('severity', 'info')
+    def pagerduty_handler(event: Event):
+        severity = event.data.get('severity', 'info')
         if severity in ('critical', 'high'):
-            message = event['data'].get('message', 'No message')
+            message = event.data.get('message', 'No message')
             print(f"  🔔 [PagerDuty] Incident created: {message}")
 
-    def audit_logger(event: Dict):
-        print(f"  📋 [Audit] Event: {event['type']} at {event['timestamp']}")
+    def audit_logger(event: Event):
+        print(f"  📋 [Audit] Event: {event.type} at {_format_ts(event.timestamp)}")
 
     # Subscribe handlers to event types
     bus.subscribe('alert.critical', slack_notifier)
-    bus.subscribe('alert.critical', pagerduty_handler)
+    bus.subscribe('alert.critical', pagerduty_handler, priority=10)  # Page first
     bus.subscribe('alert.warning', slack_notifier)
     bus.subscribe('deployment.*', slack_notifier)
     bus.subscribe('*', audit_logger)  # Audit everything
@@ -170,10 +470,10 @@ if __name__ == "__main__":
 
     # Define subscribers
     def on_build_complete(event):
-        print(f"  → Build handler: {event['data']}")
+        print(f"  → Build handler: {event.data}")
 
     def on_any_event(event):
-        print(f"  → Wildcard: event type='{event['type']}'")
+        print(f"  → Wildcard: event type='{event.type}'")
 
     bus.subscribe('build.complete', on_build_complete)
     bus.subscribe('*', on_any_event)
@@ -201,5 +501,54 @@ if __name__ == "__main__":
         'host': 'web-server-03'
     })
 
+    # Simulate deployment — delivered through the 'deployment.*' pattern
+    monitor_bus.publish('deployment.started', {
+        'message': 'Rolling out api-gateway v2.4.1',
+        'severity': 'info'
+    })
+
     # Check event history
     print(f"\n  Event history: {len(monitor_bus.get_history())} events recorded")
+
+    # ---- Example 3: Concurrent subscribers ----
+    print("\n--- Example 3: Concurrent Subscribers ---")
+    slow_bus = EventBus(max_workers=3)
+
+    def slow_webhook(event):
+        time.sleep(0.2)  # Simulates a slow HTTP call
+
+    for _ in range(3):
+        slow_bus.subscribe('incident.opened', slow_webhook)
+
+    start = time.perf_counter()
+    notified = slow_bus.publish('incident.opened', {'id': 101}, parallel=True)
+    elapsed = time.perf_counter() - start
+    print(f"  Notified {notified} slow subscribers in {elapsed:.2f}s (serial: ~0.60s)")
+    slow_bus.close()
+
+    # ---- Example 4: Publishing a burst ----
+    print("\n--- Example 4: Batch Publish ---")
+    scrape_alerts = [
+        ('alert.warning', {'message': f'Disk usage > 85% on node-{n}', 'severity': 'warning'})
+        for n in range(3)
+    ]
+    notified = monitor_bus.publish_many(scrape_alerts)
+    print(f"  {len(scrape_alerts)} alerts → {notified} notifications")
+
+    # ---- Example 5: Sharded bus for many producer threads ----
+    print("\n--- Example 5: Sharded Event Bus ---")
+    sharded = ShardedEventBus(shards=4)
+    received = []
+    sharded.subscribe('*', received.append)
+
+    def producer(prefix: str):
+        for i in range(100):
+            sharded.publish(f'{prefix}.tick', {'seq': i})
+
+    producers = [threading.Thread(target=producer, args=(p,)) for p in ('build', 'deploy', 'alert', 'audit')]
+    for t in producers:
+        t.start()
+    for t in producers:
+        t.join()
+    sharded.close()
+    print(f"  4 producers → {len(received)} deliveries, {len(sharded.get_history())} events in merged history")
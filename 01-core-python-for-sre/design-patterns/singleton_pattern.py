@@ -19,6 +19,7 @@ Prerequisites:
 """
 
 import logging
+import itertools
 import threading
 from typing import Any, Dict, Optional
 
@@ -60,6 +61,10 @@ def get_config(config_path: Optional[str] = None) -> Dict:
     """
     global _config_instance
 
+    # Fast path: once created, callers never touch the lock. functools.cache
+    # looks like a shortcut but doesn't serialize the first call — racing
+    # threads each run _load_config and can receive different dicts — and
+    # it would key on config_path instead of "first call wins"
     if _config_instance is None:
         with _config_lock:
             # Double-checked locking — check again inside the lock
@@ -127,21 +132,29 @@ class ConnectionPool:
     _instance = None
     _lock = threading.Lock()
 
-    def __new__(cls, *args, **kwargs):
+    def __new__(cls, pool_size: int = 10, host: str = "localhost"):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    # Fully initialize before publishing the instance, all
+                    # under the lock — no other thread can ever see a
+                    # half-built pool, even on a free-threaded build
+                    instance = super().__new__(cls)
+                    instance._setup(pool_size, host)
+                    cls._instance = instance
         return cls._instance
 
-    def __init__(self, pool_size: int = 10, host: str = "localhost"):
-        if self._initialized:
-            return
+    # No __init__: Python would re-run it on every ConnectionPool() call,
+    # which is exactly the unlocked re-initialization we want to avoid
+
+    def _setup(self, pool_size: int, host: str) -> None:
+        """One-time initialization — only ever called from __new__ under _lock."""
         self._pool_size = pool_size
         self._host = host
-        self._connections: list = []
-        self._initialized = True
+        # Checked-out connections keyed by id — O(1) release
+        self._connections: Dict[int, Dict[str, Any]] = {}
+        # Ids only ever increase, so a released id is never handed out twice
+        self._next_id = itertools.count(1)
         logger.info(f"ConnectionPool created: host={host}, size={pool_size}")
 
     @property
@@ -155,15 +168,14 @@ class ConnectionPool:
     def get_connection(self) -> Dict[str, Any]:
         """Get a connection from the pool."""
         if len(self._connections) < self._pool_size:
-            conn = {'id': len(self._connections) + 1, 'host': self._host}
-            self._connections.append(conn)
+            conn = {'id': next(self._next_id), 'host': self._host}
+            self._connections[conn['id']] = conn
             return conn
         raise RuntimeError("Connection pool exhausted")
 
     def release_connection(self, conn: Dict[str, Any]) -> None:
         """Return a connection to the pool."""
-        if conn in self._connections:
-            self._connections.remove(conn)
+        self._connections.pop(conn['id'], None)
 
 
 # ============================================================
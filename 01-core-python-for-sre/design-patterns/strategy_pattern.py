@@ -34,7 +34,17 @@ logger = logging.getLogger(__name__)
 # Approach 1: Function-based strategy (Pythonic)
 # ============================================================
 
-def deploy_rolling(service_name: str, version: str, **kwargs) -> Dict[str, Any]:
+# Strategies take their options as keyword-only parameters with the
+# defaults in the signature (no kwargs.get per option). **_ignored
+# absorbs options meant for other strategies, so deploy() can forward
+# one set of options whichever strategy is selected.
+def deploy_rolling(
+    service_name: str,
+    version: str,
+    *,
+    replicas: int = 3,
+    **_ignored
+) -> Dict[str, Any]:
     """
     Rolling deployment strategy.
 
@@ -52,14 +62,13 @@ def deploy_rolling(service_name: str, version: str, **kwargs) -> Dict[str, Any]:
     """
     print(f"  🔄 Rolling deploy: {service_name} → v{version}")
     print(f"     Replacing instances one by one...")
-    replicas = kwargs.get('replicas', 3)
     for i in range(replicas):
         time.sleep(0.05)
         print(f"     Instance {i + 1}/{replicas} updated")
     return {'strategy': 'rolling', 'service': service_name, 'version': version, 'status': 'success'}
 
 
-def deploy_blue_green(service_name: str, version: str, **kwargs) -> Dict[str, Any]:
+def deploy_blue_green(service_name: str, version: str, **_ignored) -> Dict[str, Any]:
     """Blue-green deployment: spin up new environment, switch traffic."""
     print(f"  🔵🟢 Blue-Green deploy: {service_name} → v{version}")
     print(f"     Spinning up green environment...")
@@ -70,9 +79,14 @@ def deploy_blue_green(service_name: str, version: str, **kwargs) -> Dict[str, An
     return {'strategy': 'blue-green', 'service': service_name, 'version': version, 'status': 'success'}
 
 
-def deploy_canary(service_name: str, version: str, **kwargs) -> Dict[str, Any]:
+def deploy_canary(
+    service_name: str,
+    version: str,
+    *,
+    canary_percent: int = 10,
+    **_ignored
+) -> Dict[str, Any]:
     """Canary deployment: route small % of traffic to new version."""
-    canary_percent = kwargs.get('canary_percent', 10)
     print(f"  🐤 Canary deploy: {service_name} → v{version}")
     print(f"     Routing {canary_percent}% traffic to canary...")
     time.sleep(0.05)
@@ -111,18 +125,20 @@ def deploy(
     Returns:
         Deployment result
     """
-    if strategy not in _deploy_strategies:
+    strategy_func = _deploy_strategies.get(strategy)
+    if strategy_func is None:
         raise ValueError(
             f"Unknown strategy: {strategy}. "
-            f"Available: {list(_deploy_strategies.keys())}"
+            f"Available: {list(_deploy_strategies)}"
         )
 
-    strategy_func = _deploy_strategies[strategy]
-    logger.info(f"Deploying {service_name} v{version} with '{strategy}' strategy")
+    # %-style args: formatted only if INFO is enabled (this runs per deploy)
+    logger.info("Deploying %s v%s with '%s' strategy", service_name, version, strategy)
 
-    start = time.time()
+    # perf_counter is monotonic — an NTP step mid-deploy can't skew duration
+    start = time.perf_counter()
     result = strategy_func(service_name, version, **kwargs)
-    result['duration'] = round(time.time() - start, 3)
+    result['duration'] = round(time.perf_counter() - start, 3)
 
     return result
 
@@ -165,9 +181,10 @@ def create_backup(
     strategy: str = 'incremental'
 ) -> Dict[str, Any]:
     """Create backup using the specified strategy."""
-    if strategy not in _backup_strategies:
+    backup_func = _backup_strategies.get(strategy)
+    if backup_func is None:
         raise ValueError(f"Unknown backup strategy: {strategy}")
-    return _backup_strategies[strategy](resource, destination)
+    return backup_func(resource, destination)
 
 
 # ============================================================
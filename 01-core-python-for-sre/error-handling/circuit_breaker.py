@@ -19,12 +19,13 @@ Prerequisites:
 """
 
 import time
+import random
 import logging
 import functools
 import threading
+from array import array
 from typing import Callable, Any, Optional, Tuple, Type
 from enum import Enum
-from dataclasses import dataclass, field
 
 # Set up logging
 logging.basicConfig(
@@ -40,14 +41,14 @@ class CircuitState(Enum):
 
     CLOSED:    Normal operation — requests flow through. Failures are counted.
     OPEN:      Too many failures — requests are immediately rejected (fast-fail).
-    HALF_OPEN: After timeout, allow ONE request through to test if service recovered.
+    HALF_OPEN: After timeout, allow ONE request at a time through to test if
+               service recovered; concurrent callers are fast-failed.
     """
     CLOSED = "closed"
     OPEN = "open"
     HALF_OPEN = "half_open"
 
 
-@dataclass
 class CircuitBreaker:
     """
     Circuit breaker that wraps function calls for fault tolerance.
@@ -61,37 +62,149 @@ class CircuitBreaker:
 
     Args:
         failure_threshold: Number of failures before opening the circuit
-        recovery_timeout: Seconds to wait before trying again (half-open)
+        recovery_timeout: Seconds to wait before trying again (half-open);
+                          doubles each time a probe fails and the circuit
+                          re-opens, so a long outage is probed less often
         success_threshold: Successful calls needed in half-open to close circuit
-        exceptions: Exception types that count as failures
+        exceptions: Exception types that count as failures (a single
+                    class or any iterable of classes)
+        max_recovery_timeout: Cap on the doubled recovery timeout
+        jitter: Randomize each wait (0.5x-1.5x) so replicas sharing a
+                dependency don't all probe it at the same instant
+        failure_rate_threshold: If set (e.g. 0.5), trip on the failure
+                                rate over the last window_size calls
+                                instead of on consecutive failures —
+                                catches a service failing every other
+                                call, which never builds a streak.
+                                failure_threshold is then the minimum
+                                number of failures in the window
+        window_size: Calls tracked by the failure-rate window
+
+    A plain class with __slots__ rather than a dataclass: no per-instance
+    __dict__, and call() reads its state from fixed slots on every call.
     """
-    failure_threshold: int = 5
-    recovery_timeout: float = 30.0
-    success_threshold: int = 2
-    exceptions: Tuple[Type[Exception], ...] = (Exception,)
-
-    # Internal state tracking (not part of constructor)
-    _state: CircuitState = field(default=CircuitState.CLOSED, init=False)
-    _failure_count: int = field(default=0, init=False)
-    _success_count: int = field(default=0, init=False)
-    _last_failure_time: float = field(default=0.0, init=False)
-    _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
+    __slots__ = (
+        'failure_threshold', 'recovery_timeout', 'success_threshold',
+        'exceptions', 'max_recovery_timeout', 'jitter',
+        'failure_rate_threshold', 'window_size',
+        '_state', '_failure_count', '_success_count', '_last_failure_time',
+        '_next_probe_time', '_open_cycles', '_window', '_window_head',
+        '_window_count', '_probe_in_flight', '_lock',
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        success_threshold: int = 2,
+        exceptions: Tuple[Type[Exception], ...] = (Exception,),
+        max_recovery_timeout: float = 300.0,
+        jitter: bool = True,
+        failure_rate_threshold: Optional[float] = None,
+        window_size: int = 128
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.success_threshold = success_threshold
+        # Fixed once here as a tuple: `except` rejects lists at match time,
+        # which would mask the real error on the first failure
+        self.exceptions = (exceptions,) if isinstance(exceptions, type) else tuple(exceptions)
+        self.max_recovery_timeout = max_recovery_timeout
+        self.jitter = jitter
+        self.failure_rate_threshold = failure_rate_threshold
+        self.window_size = window_size
+
+        # Internal state tracking (not part of constructor)
+        self._state = CircuitState.CLOSED
+        self._failure_count = 0
+        self._success_count = 0
+        # time.monotonic() reference, not a UNIX timestamp — immune to NTP/clock steps
+        self._last_failure_time = 0.0
+        # When the OPEN circuit next lets a probe through (monotonic); fixed at
+        # open time so the jittered wait isn't re-rolled on every check
+        self._next_probe_time = 0.0
+        # Times the circuit re-opened after a failed probe, since it last closed
+        self._open_cycles = 0
+        # Failure-rate mode: ring of recent CLOSED-state outcomes (1 = failed),
+        # preallocated once; _failure_count is then the failures in the ring
+        self._window: Optional[array] = (
+            array('B', bytes(window_size)) if failure_rate_threshold is not None else None
+        )
+        self._window_head = 0
+        self._window_count = 0
+        # True while the single HALF_OPEN probe call is running
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f"CircuitBreaker(state={self._state.value}, "
+            f"failure_threshold={self.failure_threshold}, "
+            f"recovery_timeout={self.recovery_timeout})"
+        )
+
+    def _record_outcome(self, failed: bool) -> None:
+        """Push one CLOSED-state outcome into the window, O(1). Caller holds _lock."""
+        head = self._window_head
+        if self._window_count == self.window_size:
+            # Full ring: the oldest outcome (at head) falls out of the window
+            self._failure_count -= self._window[head]
+        else:
+            self._window_count += 1
+        self._window[head] = failed
+        self._failure_count += failed
+        self._window_head = (head + 1) % self.window_size
+
+    def _clear_window(self) -> None:
+        """Start a fresh window, e.g. after the circuit closes. Caller holds _lock."""
+        self._window_head = 0
+        self._window_count = 0
+
+    def _should_trip(self) -> bool:
+        """Whether the CLOSED circuit has seen enough failures to open. Caller holds _lock."""
+        if self._failure_count < self.failure_threshold:
+            return False
+        if self._window is None:
+            return True
+        return self._failure_count / self._window_count >= self.failure_rate_threshold
 
     @property
     def state(self) -> CircuitState:
-        """Get current circuit state, checking if recovery timeout has elapsed."""
+        """
+        Current circuit state — a pure read, safe for metrics scrapes.
+
+        An OPEN breaker whose recovery timeout has elapsed still reads
+        OPEN here; it moves to HALF_OPEN when the next call arrives.
+        """
+        return self._state
+
+    def _open(self, now: float) -> None:
+        """
+        Move to OPEN and schedule the next probe. Caller holds _lock.
+
+        Exponential backoff with jitter, the same scheme as
+        retry_with_backoff: recovery_timeout * 2^cycles, capped at
+        max_recovery_timeout, then scaled by a random 0.5x-1.5x.
+        """
+        wait = min(self.recovery_timeout * (2 ** self._open_cycles), self.max_recovery_timeout)
+        if self.jitter:
+            wait *= 0.5 + random.random()
+        self._state = CircuitState.OPEN
+        self._next_probe_time = now + wait
+
+    def _maybe_transition_to_half_open(self, now: float) -> None:
+        """Move OPEN → HALF_OPEN once the scheduled probe time has come. Caller holds _lock."""
         # If circuit is OPEN, check if enough time has passed to try again
-        if self._state == CircuitState.OPEN:
-            elapsed = time.time() - self._last_failure_time
-            if elapsed >= self.recovery_timeout:
+        if self._state is CircuitState.OPEN:
+            if now >= self._next_probe_time:
+                elapsed = now - self._last_failure_time
                 # Transition to HALF_OPEN — allow one test request through
                 logger.info(
-                    f"Circuit breaker transitioning from OPEN to HALF_OPEN "
-                    f"(waited {elapsed:.1f}s)"
+                    "Circuit breaker transitioning from OPEN to HALF_OPEN "
+                    "(waited %.1fs)", elapsed
                 )
                 self._state = CircuitState.HALF_OPEN
                 self._success_count = 0
-        return self._state
 
     def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
         """
@@ -109,37 +222,93 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If circuit is open (fast-fail)
             Exception: Whatever func raises (if circuit is closed/half-open)
         """
-        with self._lock:
-            current_state = self.state  # property checks timeout
+        # Only the call that claimed the HALF_OPEN slot is the probe. A call
+        # admitted while CLOSED may finish after the breaker has tripped and
+        # gone HALF_OPEN; its outcome must not free the slot or count as
+        # a probe success
+        is_probe = False
+
+        # Fast path: a CLOSED breaker lets the call through on a single
+        # attribute read — no lock, so healthy traffic never serializes
+        # here. Only OPEN/HALF_OPEN need the lock to check the timeout.
+        if self._state is not CircuitState.CLOSED:
+            with self._lock:
+                now = time.monotonic()
+                self._maybe_transition_to_half_open(now)
+                current_state = self._state
+
+                # OPEN state — reject immediately (fast-fail)
+                if current_state == CircuitState.OPEN:
+                    # Just the number — the message is only formatted if
+                    # someone actually prints or logs the rejection
+                    raise CircuitBreakerOpenError(
+                        "Circuit breaker is OPEN. Service unavailable.",
+                        self._next_probe_time - now
+                    )
 
-            # OPEN state — reject immediately (fast-fail)
-            if current_state == CircuitState.OPEN:
-                raise CircuitBreakerOpenError(
-                    f"Circuit breaker is OPEN. Service unavailable. "
-                    f"Will retry after {self.recovery_timeout}s."
-                )
+                # HALF_OPEN — exactly one probe at a time; everyone else
+                # fast-fails so a recovering service isn't re-flooded
+                if self._probe_in_flight:
+                    raise CircuitBreakerOpenError(
+                        "Circuit breaker is HALF_OPEN and a probe call is "
+                        "already in flight."
+                    )
+                self._probe_in_flight = True
+                is_probe = True
 
         # CLOSED or HALF_OPEN — try the call
         try:
             result = func(*args, **kwargs)
-            # Call succeeded — record success
-            self._on_success()
+            # Call succeeded — record success, unless this is the healthy
+            # steady state (CLOSED, no failures to clear, no rate window),
+            # where there is nothing to record and we skip even the method call
+            if (is_probe or self._failure_count or self._state is not CircuitState.CLOSED
+                    or self._window is not None):
+                self._on_success(is_probe)
             return result
 
+        # Two static clauses rather than `except BaseException` plus an
+        # isinstance() dispatch: same cost on the failure path, and the
+        # success path pays nothing for either
         except self.exceptions as e:
             # Call failed — record failure
-            self._on_failure(e)
+            self._on_failure(e, is_probe)
+            raise
+
+        except BaseException:
+            # Not a counted failure, but a probe must still free its slot
+            if is_probe:
+                with self._lock:
+                    self._probe_in_flight = False
             raise
 
-    def _on_success(self) -> None:
-        """Handle a successful call — potentially close the circuit."""
+    def _on_success(self, is_probe: bool = False) -> None:
+        """
+        Handle a successful call — potentially close the circuit.
+
+        Args:
+            is_probe: Whether this call was the HALF_OPEN probe; only the
+                      probe frees the probe slot and counts toward
+                      success_threshold
+
+        call() skips this entirely in the healthy steady state (CLOSED,
+        no failures, no rate window). That unlocked check may miss a
+        racing failure; it only means this success doesn't clear it, same
+        as if the failure had landed first.
+        """
         with self._lock:
+            if is_probe:
+                self._probe_in_flight = False
+
             if self._state == CircuitState.HALF_OPEN:
+                if not is_probe:
+                    # Admitted before the trip — says nothing about recovery
+                    return
                 # Count consecutive successes in half-open state
                 self._success_count += 1
                 logger.info(
-                    f"Circuit breaker HALF_OPEN: success "
-                    f"{self._success_count}/{self.success_threshold}"
+                    "Circuit breaker HALF_OPEN: success %d/%d",
+                    self._success_count, self.success_threshold
                 )
 
                 # If we've had enough successes, close the circuit
@@ -148,37 +317,67 @@ class CircuitBreaker:
                     self._state = CircuitState.CLOSED
                     self._failure_count = 0
                     self._success_count = 0
+                    self._open_cycles = 0
+                    self._clear_window()
 
             elif self._state == CircuitState.CLOSED:
-                # Reset failure count on success in closed state
-                self._failure_count = 0
+                if self._window is not None:
+                    # Successes dilute the failure rate rather than erase it
+                    self._record_outcome(False)
+                else:
+                    # Reset failure count on success in closed state
+                    self._failure_count = 0
 
-    def _on_failure(self, error: Exception) -> None:
+    def _on_failure(self, error: Exception, is_probe: bool = False) -> None:
         """Handle a failed call — potentially open the circuit."""
         with self._lock:
-            self._failure_count += 1
-            self._last_failure_time = time.time()
+            if is_probe:
+                self._probe_in_flight = False
+            elif self._state is CircuitState.HALF_OPEN:
+                # Admitted before the trip — the in-flight probe decides
+                return
+            self._last_failure_time = time.monotonic()
+            if self._window is not None and self._state is CircuitState.CLOSED:
+                self._record_outcome(True)
+            else:
+                self._failure_count += 1
 
             if self._state == CircuitState.HALF_OPEN:
                 # Any failure in half-open goes back to open
                 logger.warning(
-                    f"Circuit breaker HALF_OPEN failed: {error}. "
-                    f"Returning to OPEN state."
+                    "Circuit breaker HALF_OPEN failed: %s. "
+                    "Returning to OPEN state.", error
                 )
-                self._state = CircuitState.OPEN
+                # Service still down — back off further before the next probe.
+                # Stop counting once the wait has hit the cap: more cycles
+                # can't lengthen it, and 2 ** cycles past ~1024 can no longer
+                # be converted to float (OverflowError in _open)
+                if (self._open_cycles < 64 and
+                        self.recovery_timeout * (2 ** self._open_cycles) < self.max_recovery_timeout):
+                    self._open_cycles += 1
+                self._open(self._last_failure_time)
 
             elif self._state == CircuitState.CLOSED:
                 # Check if we've exceeded the failure threshold
-                if self._failure_count >= self.failure_threshold:
-                    logger.error(
-                        f"Circuit breaker OPEN: {self._failure_count} failures "
-                        f"exceeded threshold of {self.failure_threshold}"
-                    )
-                    self._state = CircuitState.OPEN
+                if self._should_trip():
+                    if self._window is not None:
+                        logger.error(
+                            "Circuit breaker OPEN: %d failures exceeded threshold "
+                            "of %d (%d/%d recent calls)", self._failure_count,
+                            self.failure_threshold, self._failure_count, self._window_count
+                        )
+                    else:
+                        logger.error(
+                            "Circuit breaker OPEN: %d failures exceeded threshold of %d",
+                            self._failure_count, self.failure_threshold
+                        )
+                    self._open(self._last_failure_time)
                 else:
+                    # %-style args: formatted only if a handler takes the record —
+                    # this fires on every failure while the circuit is CLOSED
                     logger.warning(
-                        f"Circuit breaker failure "
-                        f"{self._failure_count}/{self.failure_threshold}: {error}"
+                        "Circuit breaker failure %d/%d: %s",
+                        self._failure_count, self.failure_threshold, error
                     )
 
     def reset(self) -> None:
@@ -187,6 +386,9 @@ class CircuitBreaker:
             self._state = CircuitState.CLOSED
             self._failure_count = 0
             self._success_count = 0
+            self._probe_in_flight = False
+            self._open_cycles = 0
+            self._clear_window()
             logger.info("Circuit breaker manually reset to CLOSED")
 
     def get_stats(self) -> dict:
@@ -201,24 +403,54 @@ class CircuitBreaker:
 
 
 class CircuitBreakerOpenError(Exception):
-    """Raised when a call is attempted while the circuit is open."""
-    pass
+    """
+    Raised when a call is attempted while the circuit is open.
+
+    During an outage every request ends here, so raising is kept cheap:
+    the wait travels as a plain second argument (no Python-level
+    __init__), and the "Will retry in Xs." suffix is only formatted
+    when the error is printed or logged.
+
+    Args:
+        message: What was rejected and why
+        retry_after: Optional seconds until the breaker lets a probe through
+    """
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds until the next probe, or None if unknown (e.g. a probe is in flight)."""
+        return self.args[1] if len(self.args) > 1 else None
+
+    def __str__(self) -> str:
+        retry_after = self.retry_after
+        if retry_after is None:
+            return str(self.args[0]) if self.args else ""
+        return f"{self.args[0]} Will retry in {retry_after:.1f}s."
 
 
 def circuit_breaker_decorator(
     failure_threshold: int = 5,
     recovery_timeout: float = 30.0,
     success_threshold: int = 2,
-    exceptions: Tuple[Type[Exception], ...] = (Exception,)
+    exceptions: Tuple[Type[Exception], ...] = (Exception,),
+    max_recovery_timeout: float = 300.0,
+    jitter: bool = True
 ) -> Callable:
     """
     Decorator version of circuit breaker for easy function wrapping.
 
+    All callers of the decorated function share one breaker. That does
+    not serialize them: while the circuit is CLOSED, successful calls
+    read its state without taking the lock; only failures and OPEN /
+    HALF_OPEN handling lock, and those must agree on one state anyway.
+
     Args:
         failure_threshold: Failures before opening circuit
         recovery_timeout: Seconds before trying again
         success_threshold: Successes needed to close circuit
         exceptions: Exception types that count as failures
+        max_recovery_timeout: Cap on the backed-off recovery timeout
+        jitter: Randomize recovery waits to de-synchronize replicas
 
     Returns:
         Decorated function with circuit breaker protection
@@ -232,7 +464,9 @@ def circuit_breaker_decorator(
         failure_threshold=failure_threshold,
         recovery_timeout=recovery_timeout,
         success_threshold=success_threshold,
-        exceptions=exceptions
+        exceptions=exceptions,
+        max_recovery_timeout=max_recovery_timeout,
+        jitter=jitter
     )
 
     def decorator(func: Callable) -> Callable:
@@ -19,7 +19,8 @@ Prerequisites:
 """
 
 import logging
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +33,11 @@ logger = logging.getLogger(__name__)
 # Base Exception
 # ============================================================
 
+# Shared, read-only context for errors raised without one — no empty
+# dict allocated per exception in an error storm
+_EMPTY_CONTEXT: Mapping[str, Any] = MappingProxyType({})
+
+
 class DevOpsError(Exception):
     """
     Base exception for all DevOps/SRE operations.
@@ -42,9 +48,14 @@ class DevOpsError(Exception):
     Attributes:
         message: Human-readable error description
         error_code: Machine-readable error code for monitoring/alerting
-        context: Additional context (instance ID, region, etc.)
+        context: Additional context (instance ID, region, etc.);
+                 read-only when the error was raised without any
         retryable: Whether this error is transient and can be retried
 
+    error_code and retryable are fixed per exception type, so each
+    subclass declares them as class attributes; passing them to
+    __init__ overrides them for that one instance.
+
     Interview Question:
         Q: Why create a custom exception hierarchy?
         A: 1. Distinguishes our errors from system/library errors
@@ -53,39 +64,68 @@ class DevOpsError(Exception):
            4. Machine-readable error codes for monitoring dashboards
     """
 
+    # Plain class attributes, not ClassVar: __init__ may override them
+    # per instance
+    error_code: str = "DEVOPS_ERROR"
+    retryable: bool = False
+
     def __init__(
         self,
         message: str,
         error_code: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
-        retryable: bool = False
+        retryable: Optional[bool] = None
     ):
-        # Call the base Exception constructor with the message
+        # Call the base Exception constructor with the message; it lives
+        # in self.args and .message reads it from there
         super().__init__(message)
-        self.message = message
-        self.error_code = error_code or "DEVOPS_ERROR"
-        self.context = context or {}
-        self.retryable = retryable
+        self.context = context or _EMPTY_CONTEXT
+        # Only per-instance overrides are stored; otherwise the class value applies
+        if error_code is not None:
+            self.error_code = error_code
+        if retryable is not None:
+            self.retryable = retryable
+        self._str_cache: Optional[str] = None
+        self._dict_cache: Optional[Dict[str, Any]] = None
+
+    @property
+    def message(self) -> str:
+        """Human-readable error description (the exception's first arg)."""
+        return self.args[0]
 
     def __str__(self) -> str:
         """Format error with code and context for readable logging."""
-        parts = [f"[{self.error_code}] {self.message}"]
-        if self.context:
-            ctx_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
-            parts.append(f"Context: {ctx_str}")
-        if self.retryable:
-            parts.append("(retryable)")
-        return " | ".join(parts)
+        # Built on first use and reused — the same error is often logged,
+        # re-raised and logged again on its way up the stack
+        if self._str_cache is None:
+            parts = [f"[{self.error_code}] {self.message}"]
+            if self.context:
+                ctx_str = ", ".join(f"{k}={v}" for k, v in self.context.items())
+                parts.append(f"Context: {ctx_str}")
+            if self.retryable:
+                parts.append("(retryable)")
+            self._str_cache = " | ".join(parts)
+        return self._str_cache
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for structured logging / API responses."""
-        return {
-            "error_code": self.error_code,
-            "message": self.message,
-            "context": self.context,
-            "retryable": self.retryable,
-            "type": type(self).__name__
-        }
+        """
+        Convert to dictionary for structured logging / API responses.
+
+        Built once and cached, since an error is often serialized to
+        several sinks (log, metrics, API response). Each call still
+        returns its own copy — context included — that the caller may
+        mutate or json.dumps() freely.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "error_code": self.error_code,
+                "message": self.message,
+                "context": dict(self.context),
+                "retryable": self.retryable,
+                "type": type(self).__name__
+            }
+        cached = self._dict_cache
+        return {**cached, "context": dict(cached["context"])}
 
 
 # ============================================================
@@ -113,14 +153,10 @@ class CloudProviderError(DevOpsError):
 class ResourceNotFoundError(CloudProviderError):
     """Resource (instance, bucket, pod) does not exist."""
 
+    error_code = "RESOURCE_NOT_FOUND"
+
     def __init__(self, resource_type: str, resource_id: str, **kwargs):
-        message = f"{resource_type} '{resource_id}' not found"
-        super().__init__(
-            message,
-            error_code="RESOURCE_NOT_FOUND",
-            retryable=False,
-            **kwargs
-        )
+        super().__init__(f"{resource_type} '{resource_id}' not found", **kwargs)
         self.resource_type = resource_type
         self.resource_id = resource_id
 
@@ -128,44 +164,36 @@ class ResourceNotFoundError(CloudProviderError):
 class ResourceLimitError(CloudProviderError):
     """Cloud resource limit/quota exceeded."""
 
+    error_code = "RESOURCE_LIMIT_EXCEEDED"
+
     def __init__(self, resource_type: str, limit: int, current: int, **kwargs):
         message = (
             f"{resource_type} limit exceeded: "
             f"{current}/{limit} used"
         )
-        super().__init__(
-            message,
-            error_code="RESOURCE_LIMIT_EXCEEDED",
-            retryable=False,
-            **kwargs
-        )
+        super().__init__(message, **kwargs)
 
 
 class AuthenticationError(CloudProviderError):
     """Authentication or authorization failure."""
 
+    error_code = "AUTH_FAILED"
+
     def __init__(self, message: str = "Authentication failed", **kwargs):
-        super().__init__(
-            message,
-            error_code="AUTH_FAILED",
-            retryable=False,
-            **kwargs
-        )
+        super().__init__(message, **kwargs)
 
 
 class RateLimitError(CloudProviderError):
     """API rate limit exceeded — retryable with backoff."""
 
+    error_code = "RATE_LIMIT"
+    retryable = True  # Rate limits are transient
+
     def __init__(self, service: str, retry_after: Optional[float] = None, **kwargs):
         message = f"Rate limit exceeded for {service}"
         if retry_after:
             message += f" (retry after {retry_after}s)"
-        super().__init__(
-            message,
-            error_code="RATE_LIMIT",
-            retryable=True,  # Rate limits are transient
-            **kwargs
-        )
+        super().__init__(message, **kwargs)
         self.retry_after = retry_after
 
 
@@ -191,24 +219,21 @@ class KubernetesError(DevOpsError):
 class PodNotFoundError(KubernetesError):
     """Pod does not exist in the specified namespace."""
 
+    error_code = "POD_NOT_FOUND"
+
     def __init__(self, pod_name: str, namespace: str = "default"):
-        super().__init__(
-            f"Pod '{pod_name}' not found",
-            namespace=namespace,
-            error_code="POD_NOT_FOUND",
-            retryable=False
-        )
+        super().__init__(f"Pod '{pod_name}' not found", namespace=namespace)
 
 
 class DeploymentFailedError(KubernetesError):
     """Deployment rollout failed."""
 
+    error_code = "DEPLOYMENT_FAILED"
+
     def __init__(self, deployment_name: str, reason: str, namespace: str = "default"):
         super().__init__(
             f"Deployment '{deployment_name}' failed: {reason}",
-            namespace=namespace,
-            error_code="DEPLOYMENT_FAILED",
-            retryable=False
+            namespace=namespace
         )
 
 
@@ -224,24 +249,22 @@ class PipelineError(DevOpsError):
 class BuildFailedError(PipelineError):
     """Build or pipeline execution failed."""
 
+    error_code = "BUILD_FAILED"
+
     def __init__(self, pipeline_name: str, build_number: int, reason: str = ""):
         super().__init__(
             f"Build #{build_number} of '{pipeline_name}' failed: {reason}",
-            error_code="BUILD_FAILED",
-            context={"pipeline": pipeline_name, "build_number": build_number},
-            retryable=False
+            context={"pipeline": pipeline_name, "build_number": build_number}
         )
 
 
 class ArtifactNotFoundError(PipelineError):
     """Build artifact not found."""
 
+    error_code = "ARTIFACT_NOT_FOUND"
+
     def __init__(self, artifact_path: str):
-        super().__init__(
-            f"Artifact not found: {artifact_path}",
-            error_code="ARTIFACT_NOT_FOUND",
-            retryable=False
-        )
+        super().__init__(f"Artifact not found: {artifact_path}")
 
 
 # ============================================================
@@ -19,8 +19,12 @@ Prerequisites:
 """
 
 import time
+import atexit
 import logging
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 from functools import wraps
 
 logging.basicConfig(
@@ -61,33 +65,49 @@ def with_fallback(
            - Search results without personalization vs no results
            - Cached data (possibly stale) vs no data at all
     """
+    # Resolve the logging method once — also fails fast on a bad log_level
+    # instead of on the first exception
+    log_func = getattr(logger, log_level)
+
     def decorator(func: Callable) -> Callable:
+        def log_failure(e: BaseException) -> None:
+            # Log the failure at the appropriate level
+            log_func(f"Function '{func.__name__}' failed: {e}. Using fallback.")
+
+        # fallback_func is fixed at decoration time, so pick the matching
+        # wrapper once rather than re-checking it on every failure
+        if fallback_func is None:
+            @wraps(func)
+            def wrapper_static(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    log_failure(e)
+                    return fallback_value
+
+            return wrapper_static
+
+        # Bound locally so the closure sees the narrowed, non-None type
+        dynamic_fallback: Callable = fallback_func
+
         @wraps(func)
-        def wrapper(*args: Any, **kwargs: Any) -> Any:
+        def wrapper_dynamic(*args: Any, **kwargs: Any) -> Any:
             try:
                 return func(*args, **kwargs)
             except exceptions as e:
-                # Log the failure at the appropriate level
-                log_func = getattr(logger, log_level)
-                log_func(
-                    f"Function '{func.__name__}' failed: {e}. "
-                    f"Using fallback."
-                )
+                log_failure(e)
 
                 # Dynamic fallback takes priority
-                if fallback_func is not None:
-                    try:
-                        return fallback_func(*args, **kwargs)
-                    except Exception as fb_err:
-                        logger.error(
-                            f"Fallback function also failed: {fb_err}. "
-                            f"Returning static fallback: {fallback_value}"
-                        )
-                        return fallback_value
-
-                return fallback_value
-
-        return wrapper
+                try:
+                    return dynamic_fallback(*args, **kwargs)
+                except Exception as fb_err:
+                    logger.error(
+                        f"Fallback function also failed: {fb_err}. "
+                        f"Returning static fallback: {fallback_value}"
+                    )
+                    return fallback_value
+
+        return wrapper_dynamic
     return decorator
 
 
@@ -153,6 +173,9 @@ class SimpleCache:
     When the primary data source is down, the cache can serve
     the last-known-good data (potentially stale but better than nothing).
 
+    Thread-safe: every read also reorders the LRU list, so get() and
+    set() both take one lock (logging happens after it is released).
+
     Interview Question:
         Q: How do you decide between stale data and no data?
         A: Depends on the use case. For dashboards, stale data with
@@ -160,13 +183,23 @@ class SimpleCache:
            For financial transactions, no data is better than stale data.
     """
 
-    def __init__(self, default_ttl: float = 300.0):
+    def __init__(self, default_ttl: float = 300.0, maxsize: int = 1024):
         """
         Args:
             default_ttl: Default time-to-live for cache entries in seconds
+            maxsize: Max entries kept; the least recently used is evicted
+                     beyond that (expired entries are kept as stale
+                     fallbacks until evicted or overwritten)
         """
-        self._store: Dict[str, dict] = {}
+        # key -> (expires_at, value), least recently used first. expires_at is
+        # a time.monotonic() deadline, so wall-clock steps (NTP, manual
+        # changes) can't expire or resurrect entries early
+        self._store: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
         self._default_ttl = default_ttl
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        # Refreshes in flight, per key (single-flight; see join_flight)
+        self._inflight: Dict[str, threading.Event] = {}
 
     def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
         """
@@ -179,11 +212,18 @@ class SimpleCache:
         Returns:
             Cached value or None
         """
-        if key not in self._store:
-            return None
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
 
-        entry = self._store[key]
-        is_expired = time.time() > entry['expires_at']
+            expires_at, value = entry
+            is_expired = time.monotonic() > expires_at
+
+            if not is_expired or allow_stale:
+                # Served — mark as most recently used so it's evicted last.
+                # Same lock as set(): the entry can't be evicted in between
+                self._store.move_to_end(key)
 
         if is_expired and not allow_stale:
             logger.debug(f"Cache entry '{key}' expired")
@@ -192,19 +232,130 @@ class SimpleCache:
         if is_expired and allow_stale:
             logger.warning(f"Serving STALE cache entry for '{key}' (degraded mode)")
 
-        return entry['value']
+        return value
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
-        """Store a value in the cache."""
-        self._store[key] = {
-            'value': value,
-            'expires_at': time.time() + (ttl or self._default_ttl),
-            'created_at': time.time()
-        }
+        """Store a value in the cache, evicting the LRU entry if full."""
+        entry = (time.monotonic() + (ttl or self._default_ttl), value)
+        with self._lock:
+            store = self._store
+            store[key] = entry
+            # Overwriting an existing key keeps its old position otherwise
+            store.move_to_end(key)
+            if len(store) > self._maxsize:
+                store.popitem(last=False)
+
+    def peek(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Return (value, seconds past expiry) without logging, or None if absent.
+
+        The age is negative while the entry is still fresh. Like get(),
+        a hit marks the entry as most recently used.
+        """
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            self._store.move_to_end(key)
+        expires_at, value = entry
+        return value, time.monotonic() - expires_at
+
+    def join_flight(self, key: str) -> Tuple[threading.Event, bool]:
+        """
+        Join the refresh in flight for key, or start one.
+
+        Returns:
+            (event, is_leader). The leader must call end_flight() when
+            done; followers wait on the event, then read the cache.
+        """
+        with self._lock:
+            flight = self._inflight.get(key)
+            if flight is not None:
+                return flight, False
+            flight = self._inflight[key] = threading.Event()
+            return flight, True
+
+    def end_flight(self, key: str) -> None:
+        """Finish the leader's refresh for key and wake its followers."""
+        with self._lock:
+            flight = self._inflight.pop(key)
+        flight.set()
 
     def clear(self) -> None:
         """Clear all cached entries."""
-        self._store.clear()
+        with self._lock:
+            self._store.clear()
+
+
+def _refresh(
+    cache: SimpleCache,
+    cache_key: str,
+    primary_func: Callable[..., T],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    ttl: float
+) -> Optional[T]:
+    """Leader side of a refresh: fetch, cache, fall back to stale, release waiters."""
+    try:
+        # Try primary source
+        result = primary_func(*args, **kwargs)
+
+        # Cache the fresh result for future fallback
+        cache.set(cache_key, result, ttl=ttl)
+        logger.info(f"Fetched fresh data and cached as '{cache_key}'")
+        return result
+
+    except Exception as e:
+        logger.warning(
+            f"Primary source failed: {e}. "
+            f"Falling back to cached data for '{cache_key}'"
+        )
+
+        # Return stale cached data — better than nothing
+        stale_data = cache.get(cache_key, allow_stale=True)
+        if stale_data is not None:
+            return stale_data
+
+        logger.error(f"No cached data available for '{cache_key}'")
+        return None
+
+    finally:
+        # Release waiters only after the cache holds the outcome
+        cache.end_flight(cache_key)
+
+
+# Background revalidations for stale_while_revalidate, created on first use
+_revalidate_pool: Optional[ThreadPoolExecutor] = None
+_revalidate_pool_lock = threading.Lock()
+
+
+def _get_revalidate_pool() -> ThreadPoolExecutor:
+    """Shared revalidation pool; recreated if it was shut down."""
+    global _revalidate_pool
+    if _revalidate_pool is None:
+        with _revalidate_pool_lock:
+            if _revalidate_pool is None:
+                _revalidate_pool = ThreadPoolExecutor(
+                    max_workers=4, thread_name_prefix="revalidate"
+                )
+    return _revalidate_pool
+
+
+def shutdown_revalidation(wait: bool = True) -> None:
+    """
+    Stop the background revalidation threads, if they were started.
+
+    Registered with atexit; call it directly when tearing down a
+    service (or between tests). A later stale hit starts a new pool.
+    """
+    global _revalidate_pool
+    with _revalidate_pool_lock:
+        pool, _revalidate_pool = _revalidate_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+atexit.register(shutdown_revalidation)
 
 
 def cached_degradation(
@@ -213,6 +364,7 @@ def cached_degradation(
     primary_func: Callable[..., T],
     *args: Any,
     ttl: float = 300.0,
+    stale_while_revalidate: float = 0.0,
     **kwargs: Any
 ) -> Optional[T]:
     """
@@ -221,16 +373,29 @@ def cached_degradation(
     This is a common pattern: always try the primary source first,
     cache successful results, and fall back to stale cache when primary fails.
 
+    Concurrent calls for the same cache_key are coalesced: one caller
+    runs primary_func, the others wait for it and then read the cache.
+    During an incident, N callers cost the struggling backend one
+    request instead of N (no thundering herd).
+
+    With stale_while_revalidate > 0 the cache is consulted first: a
+    fresh entry is returned as-is, and an entry expired by at most
+    stale_while_revalidate seconds is returned immediately while a
+    background thread refreshes it — callers never wait on primary_func
+    at TTL expiry. Older or missing entries take the normal path.
+
     Args:
         cache: SimpleCache instance
         cache_key: Key to use in the cache
         primary_func: Primary data source function
         *args: Arguments for primary_func
         ttl: Cache time-to-live in seconds
+        stale_while_revalidate: Seconds past expiry a cached entry may
+                                still be served while it is refreshed
         **kwargs: Keyword arguments for primary_func
 
     Returns:
-        Data from primary source or stale cache
+        Data from primary source or (stale) cache
 
     Example:
         cache = SimpleCache(default_ttl=60)
@@ -239,28 +404,33 @@ def cached_degradation(
             fetch_user_preferences, user_id=123
         )
     """
-    try:
-        # Try primary source
-        result = primary_func(*args, **kwargs)
-
-        # Cache the fresh result for future fallback
-        cache.set(cache_key, result, ttl=ttl)
-        logger.info(f"Fetched fresh data and cached as '{cache_key}'")
-        return result
-
-    except Exception as e:
-        logger.warning(
-            f"Primary source failed: {e}. "
-            f"Falling back to cached data for '{cache_key}'"
-        )
-
-        # Return stale cached data — better than nothing
-        stale_data = cache.get(cache_key, allow_stale=True)
-        if stale_data is not None:
-            return stale_data
-
-        logger.error(f"No cached data available for '{cache_key}'")
-        return None
+    if stale_while_revalidate > 0:
+        hit = cache.peek(cache_key)
+        if hit is not None:
+            value, overdue = hit
+            if overdue <= 0:
+                return value
+            if overdue <= stale_while_revalidate:
+                _, is_leader = cache.join_flight(cache_key)
+                if is_leader:
+                    logger.info(f"Serving stale '{cache_key}' while revalidating in background")
+                    try:
+                        _get_revalidate_pool().submit(
+                            _refresh, cache, cache_key, primary_func, args, kwargs, ttl
+                        )
+                    except RuntimeError:
+                        # Pool shut down under us (interpreter exit) — the
+                        # refresh will never run, so don't strand followers
+                        cache.end_flight(cache_key)
+                return value
+
+    flight, is_leader = cache.join_flight(cache_key)
+    if not is_leader:
+        # Leader's fresh result if it succeeded, stale data if it failed
+        flight.wait()
+        return cache.get(cache_key, allow_stale=True)
+
+    return _refresh(cache, cache_key, primary_func, args, kwargs, ttl)
 
 
 # ============================================================
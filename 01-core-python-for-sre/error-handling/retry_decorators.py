@@ -70,12 +70,19 @@ def retry_with_backoff(
            service time to recover. Combined with jitter, it prevents
            multiple clients from retrying simultaneously (thundering herd).
     """
+    # The backoff schedule depends only on the decorator arguments, so
+    # build it once: delays[i] = initial_delay * backoff_factor^i, capped
+    # at max_delay (grown by multiplication, which saturates at inf
+    # instead of raising OverflowError like ** would for huge max_retries)
+    delays = []
+    delay = initial_delay
+    for _ in range(max_retries):
+        delays.append(min(delay, max_delay))
+        delay *= backoff_factor
+
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Track the current delay — starts at initial_delay
-            delay = initial_delay
-
             # Attempt the function call up to max_retries + 1 times
             for attempt in range(max_retries + 1):
                 try:
@@ -99,9 +106,9 @@ def retry_with_backoff(
                         # Re-raise the last exception — caller needs to handle it
                         raise
 
-                    # Calculate the next delay with exponential backoff
+                    # Next delay from the precomputed exponential backoff
                     # Formula: delay = initial_delay * (backoff_factor ^ attempt)
-                    current_delay = min(delay, max_delay)
+                    current_delay = delays[attempt]
 
                     # Add jitter to prevent thundering herd
                     # Jitter randomizes the delay so multiple clients don't
@@ -117,9 +124,6 @@ def retry_with_backoff(
                     # Wait before retrying
                     time.sleep(current_delay)
 
-                    # Increase delay for next retry (exponential growth)
-                    delay *= backoff_factor
-
         return wrapper
     return decorator
 
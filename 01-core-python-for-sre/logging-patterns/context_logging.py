@@ -54,34 +54,45 @@ class ContextLogger:
 
     def __init__(self, name: str = __name__):
         self._logger = logging.getLogger(name)
+        # Bound once — checked before every message is formatted
+        self._is_enabled = self._logger.isEnabledFor
 
     def _format_message(self, message: str) -> str:
         """Prepend context info to the log message."""
-        ctx_parts = []
         req_id = _request_id.get()
+        user = _user_id.get()
+        operation = _operation.get()
+        # No context set (startup, background tasks) — nothing to prepend
+        if req_id == 'no-request' and user == 'anonymous' and not operation:
+            return message
+
+        ctx_parts = []
         if req_id != 'no-request':
             ctx_parts.append(f"req={req_id}")
-        user = _user_id.get()
         if user != 'anonymous':
             ctx_parts.append(f"user={user}")
-        operation = _operation.get()
         if operation:
             ctx_parts.append(f"op={operation}")
+        return f"[{' '.join(ctx_parts)}] {message}"
 
-        prefix = f"[{' '.join(ctx_parts)}] " if ctx_parts else ""
-        return f"{prefix}{message}"
+    # Each level checks isEnabledFor first, so a filtered-out message
+    # (e.g. debug in production) never reads the context or builds a prefix
 
     def info(self, message: str, **kwargs) -> None:
-        self._logger.info(self._format_message(message), **kwargs)
+        if self._is_enabled(logging.INFO):
+            self._logger.info(self._format_message(message), **kwargs)
 
     def warning(self, message: str, **kwargs) -> None:
-        self._logger.warning(self._format_message(message), **kwargs)
+        if self._is_enabled(logging.WARNING):
+            self._logger.warning(self._format_message(message), **kwargs)
 
     def error(self, message: str, **kwargs) -> None:
-        self._logger.error(self._format_message(message), **kwargs)
+        if self._is_enabled(logging.ERROR):
+            self._logger.error(self._format_message(message), **kwargs)
 
     def debug(self, message: str, **kwargs) -> None:
-        self._logger.debug(self._format_message(message), **kwargs)
+        if self._is_enabled(logging.DEBUG):
+            self._logger.debug(self._format_message(message), **kwargs)
 
 
 def set_request_context(
@@ -146,14 +157,18 @@ def with_logging_context(
             ...
     """
     def decorator(func: Callable) -> Callable:
+        # Fixed per decorated function — resolved once here, not on every
+        # call (getLogger takes the logging module lock)
+        op_name = operation or func.__name__
+        ctx_logger = ContextLogger(func.__module__)
+
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            op_name = operation or func.__name__
-            ctx_logger = ContextLogger(func.__module__)
-
             # Set operation context
             tokens = set_request_context(operation=op_name)
-            start_time = time.time()
+            # perf_counter is monotonic — an NTP step can't make a
+            # duration negative or inflate it
+            start_time = time.perf_counter()
 
             # Optionally log arguments
             if log_args:
@@ -165,7 +180,7 @@ def with_logging_context(
                 result = func(*args, **kwargs)
 
                 # Log timing
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 if log_timing:
                     ctx_logger.info(f"Completed in {elapsed:.3f}s")
                 if log_result:
@@ -174,7 +189,7 @@ def with_logging_context(
                 return result
 
             except Exception as e:
-                elapsed = time.time() - start_time
+                elapsed = time.perf_counter() - start_time
                 ctx_logger.error(f"Failed after {elapsed:.3f}s: {e}")
                 raise
 
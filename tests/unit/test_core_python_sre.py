@@ -0,0 +1,247 @@
+"""
+test_core_python_sre.py
+
+Unit tests for Module 01 — Core Python for SRE (rate limiting, circuit
+breaking, cached degradation and credit-based throttling).
+"""
+
+import os
+import sys
+import time
+import asyncio
+import threading
+
+MODULE_DIR = os.path.join(
+    os.path.dirname(__file__), '..', '..', '01-core-python-for-sre'
+)
+# Example directories have hyphens in their names, so import from each
+# directory directly rather than as packages
+for _subdir in ('concurrency', 'error-handling', 'async-programming'):
+    sys.path.insert(0, os.path.join(MODULE_DIR, _subdir))
+
+from queue_patterns import TokenBucket  # noqa: E402
+from circuit_breaker import CircuitBreaker, CircuitState  # noqa: E402
+from graceful_degradation import (  # noqa: E402
+    SimpleCache, cached_degradation, shutdown_revalidation
+)
+from async_api_calls import CreditSemaphore  # noqa: E402
+
+
+def _expect_value_error(func, *args) -> None:
+    """Assert that func(*args) raises ValueError."""
+    try:
+        func(*args)
+    except ValueError:
+        return
+    raise AssertionError(f"{func.__name__}{args} did not raise ValueError")
+
+
+def test_token_bucket_rejects_overdraw():
+    """Taking more tokens than the bucket can ever hold fails fast."""
+    bucket = TokenBucket(rate=10.0, capacity=2.0)
+    _expect_value_error(bucket.take, 3.0)
+    # A request that fits still succeeds after the rejected one
+    bucket.take(2.0)
+    print("  ✅ test_token_bucket_rejects_overdraw")
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    """A zero or negative rate is rejected instead of dividing by zero later."""
+    _expect_value_error(TokenBucket, 0)
+    _expect_value_error(TokenBucket, -1.0)
+    _expect_value_error(TokenBucket, 1.0, 0)
+    print("  ✅ test_token_bucket_rejects_non_positive_rate")
+
+
+def test_token_bucket_paces_calls():
+    """After the burst is spent, calls proceed at roughly `rate` per second."""
+    bucket = TokenBucket(rate=50.0, capacity=1.0)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.take()
+    elapsed = time.monotonic() - start
+    # One token up front, five more refilled at 50/s ≈ 0.1s
+    assert 0.08 <= elapsed < 1.0, f"Unexpected pacing: {elapsed:.3f}s"
+    print("  ✅ test_token_bucket_paces_calls")
+
+
+def _fail() -> None:
+    raise ConnectionError("down")
+
+
+def _succeed() -> str:
+    return "ok"
+
+
+def _run(breaker: CircuitBreaker, outcomes: str) -> None:
+    """Feed a sequence of F(ail)/S(ucceed) calls through the breaker."""
+    for outcome in outcomes:
+        try:
+            breaker.call(_fail if outcome == 'F' else _succeed)
+        except ConnectionError:
+            pass
+
+
+def test_circuit_breaker_rate_window_trips_on_alternating_failures():
+    """Every-other-call failures never build a streak but do trip the rate window."""
+    streak = CircuitBreaker(failure_threshold=2, jitter=False)
+    _run(streak, 'FSFSFSFS')
+    assert streak.state == CircuitState.CLOSED
+
+    windowed = CircuitBreaker(
+        failure_threshold=2, failure_rate_threshold=0.5, window_size=4, jitter=False
+    )
+    _run(windowed, 'FSF')
+    assert windowed.state == CircuitState.OPEN
+    print("  ✅ test_circuit_breaker_rate_window_trips_on_alternating_failures")
+
+
+def test_circuit_breaker_rate_window_forgets_old_failures():
+    """Failures that roll out of the window no longer count toward the rate."""
+    breaker = CircuitBreaker(
+        failure_threshold=2, failure_rate_threshold=0.75, window_size=4, jitter=False
+    )
+    # The first failure falls out once four newer calls have been recorded
+    _run(breaker, 'FSSSSFF')
+    assert breaker.state == CircuitState.CLOSED, "2/4 is below the 75% threshold"
+
+    _run(breaker, 'F')
+    assert breaker.state == CircuitState.OPEN, "3/4 meets the 75% threshold"
+    print("  ✅ test_circuit_breaker_rate_window_forgets_old_failures")
+
+
+def test_cached_degradation_single_flight():
+    """Concurrent misses for one key call the primary source once."""
+    cache = SimpleCache()
+    calls = []
+    release = threading.Event()
+
+    def slow_fetch() -> int:
+        calls.append(1)
+        release.wait(5)
+        return 42
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(cached_degradation(cache, 'k', slow_fetch))
+        )
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)  # let every thread reach the cache
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1, f"primary called {len(calls)} times"
+    assert results == [42] * 8
+    print("  ✅ test_cached_degradation_single_flight")
+
+
+def test_cached_degradation_serves_stale_while_revalidating():
+    """A recently expired entry is returned at once and refreshed in the background."""
+    cache = SimpleCache()
+    cache.set('k', 'old', ttl=0.01)
+    time.sleep(0.05)
+
+    refreshed = threading.Event()
+
+    def fetch_new() -> str:
+        refreshed.set()
+        return 'new'
+
+    try:
+        assert cached_degradation(cache, 'k', fetch_new, stale_while_revalidate=5.0) == 'old'
+        assert refreshed.wait(5), "background refresh never ran"
+        # Wait for the refresh to finish and release its flight
+        shutdown_revalidation()
+        assert cache.get('k') == 'new'
+    finally:
+        shutdown_revalidation()
+    print("  ✅ test_cached_degradation_serves_stale_while_revalidating")
+
+
+def test_cached_degradation_falls_back_to_stale_on_failure():
+    """When the primary fails, the expired entry is served instead of None."""
+    cache = SimpleCache()
+    cache.set('k', 'last-known-good', ttl=0.01)
+    time.sleep(0.05)
+    assert cached_degradation(cache, 'k', _fail) == 'last-known-good'
+    print("  ✅ test_cached_degradation_falls_back_to_stale_on_failure")
+
+
+def test_credit_semaphore_rejects_impossible_cost():
+    """A call costing more than the whole budget can never run."""
+    credits = CreditSemaphore(total_credits=10)
+    try:
+        asyncio.run(credits.acquire(11))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("acquire(11) on a 10-credit budget did not raise")
+    _expect_value_error(CreditSemaphore, 0)
+    print("  ✅ test_credit_semaphore_rejects_impossible_cost")
+
+
+def test_credit_semaphore_waits_for_refund():
+    """Callers that don't fit wait until spent credits are refunded."""
+    async def scenario() -> None:
+        credits = CreditSemaphore(total_credits=10, refill_interval=0.05)
+
+        async def work() -> str:
+            return "done"
+
+        assert await credits.transact(work(), credits=8) == "done"
+        assert credits.available == 2
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await credits.transact(work(), credits=5) == "done"
+        assert loop.time() - start >= 0.04, "ran before the refund"
+
+    asyncio.run(scenario())
+    print("  ✅ test_credit_semaphore_waits_for_refund")
+
+
+def test_credit_semaphore_lets_small_request_pass_large_waiter():
+    """A cheap request that fits goes ahead of a larger one still waiting."""
+    async def scenario() -> None:
+        credits = CreditSemaphore(total_credits=10, refill_interval=0.05)
+
+        async def work() -> None:
+            return None
+
+        # Spent now, refunded 0.05s after it completes
+        await credits.transact(work(), credits=7)
+
+        large = asyncio.ensure_future(credits.acquire(5))
+        await asyncio.sleep(0)
+        assert not large.done()
+
+        # 3 credits are left: enough for a small request, not the large one
+        await asyncio.wait_for(credits.acquire(3), timeout=0.1)
+        assert not large.done()
+
+        # The refund brings the large waiter back within budget
+        await asyncio.wait_for(large, timeout=1.0)
+
+    asyncio.run(scenario())
+    print("  ✅ test_credit_semaphore_lets_small_request_pass_large_waiter")
+
+
+if __name__ == "__main__":
+    print("Core Python for SRE Unit Tests")
+    test_token_bucket_rejects_overdraw()
+    test_token_bucket_rejects_non_positive_rate()
+    test_token_bucket_paces_calls()
+    test_circuit_breaker_rate_window_trips_on_alternating_failures()
+    test_circuit_breaker_rate_window_forgets_old_failures()
+    test_cached_degradation_single_flight()
+    test_cached_degradation_serves_stale_while_revalidating()
+    test_cached_degradation_falls_back_to_stale_on_failure()
+    test_credit_semaphore_rejects_impossible_cost()
+    test_credit_semaphore_waits_for_refund()
+    test_credit_semaphore_lets_small_request_pass_large_waiter()
+    print("  All tests passed!")